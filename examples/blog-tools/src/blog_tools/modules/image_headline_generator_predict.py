@@ -11,3 +11,7 @@ class ImageHeadlineGeneratorPredict(dspy.Module):
     def forward(self, image: dspy.Image) -> dspy.Prediction:
         description = self.image_describer(image=image).image_description
         return self.headline_generator(blog_post=description)
+
+    async def aforward(self, image: dspy.Image) -> dspy.Prediction:
+        description = (await self.image_describer.acall(image=image)).image_description
+        return await self.headline_generator.acall(blog_post=description)
@@ -1,28 +1,39 @@
 """Example DSPy module using Predict."""
 
+import asyncio
+import functools
+import os
+
 import dspy
 from dotenv import load_dotenv
 from code_review_agent.signatures.review_pr import PRReview, ReviewPR
-from code_review_agent.utils import download_and_format_pr, build_github_tools
+from code_review_agent.utils import adownload_and_format_pr, build_github_tools
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_tools() -> tuple[dspy.Tool, ...]:
+    """Build the GitHub tools once per process; they don't vary per instance."""
+    return tuple(build_github_tools())
+
 
 class PRReviewer(dspy.Module):
     def __init__(self):
         super().__init__()
-        self.predictor = dspy.ReAct(ReviewPR, tools=build_github_tools())
+        self.predictor = dspy.ReAct(ReviewPR, tools=list(_cached_tools()))
 
-    async def aforward(self, repo: str, pr_number: int) -> PRReview:
+    async def aforward(self, repo: str, pr_number: int, head_sha: str | None = None) -> PRReview:
         """
         Review a PR from repository name and PR number.
         
         Args:
             repo: Repository in format "owner/repo"
             pr_number: PR number
-            github_token: Optional GitHub token (uses GITHUB_TOKEN env var if not provided)
+            head_sha: Optional head commit SHA; enables reuse of already-fetched PR data
         
         Returns:
             PR review result
         """
-        pr_data = download_and_format_pr(repo=repo, pr_number=pr_number)
+        pr_data = await adownload_and_format_pr(repo=repo, pr_number=pr_number, head_sha=head_sha)
         
         result = await self.predictor.acall(
             pr_metadata=pr_data['pr_metadata'],
@@ -45,11 +56,12 @@ async def main():
 
 # Usage
 if __name__ == "__main__":
-    import asyncio
-    import mlflow
-
-    mlflow.set_tracking_uri("http://127.0.0.1:5001")
-    mlflow.dspy.autolog()
     load_dotenv()
 
+    if os.environ.get("MLFLOW_ENABLE"):
+        import mlflow
+
+        mlflow.set_tracking_uri("http://127.0.0.1:5001")
+        mlflow.dspy.autolog()
+
     asyncio.run(main())
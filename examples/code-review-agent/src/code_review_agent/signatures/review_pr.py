@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 class EditType(str, Enum):
     ADDED = "added"
@@ -46,12 +46,11 @@ class TodoSection(BaseModel):
 
 class PRReview(BaseModel):
     """Complete PR review output"""
-    
+
     estimated_effort_to_review: int = Field(
         ge=1, 
         le=5,
-        description="Effort required to review (1=minimal, 5=extensive)",
-        alias="estimated_effort_to_review_[1-5]"
+        description="Effort required to review, from 1 to 5 (1=minimal, 5=extensive)"
     )
     
     relevant_tests: str = Field(
@@ -84,9 +83,16 @@ class PRReview(BaseModel):
         None,
         description="Estimated time to implement changes"
     )
-    
-    class Config:
-        populate_by_name = True
+
+    @model_validator(mode="before")
+    @classmethod
+    def _accept_legacy_effort_key(cls, data):
+        """Map the old `estimated_effort_to_review_[1-5]` key onto the field."""
+        if isinstance(data, dict) and "estimated_effort_to_review_[1-5]" in data:
+            data = dict(data)
+            legacy = data.pop("estimated_effort_to_review_[1-5]")
+            data.setdefault("estimated_effort_to_review", legacy)
+        return data
 
 class KeyIssuesComponentLink(BaseModel):
     relevant_file: str
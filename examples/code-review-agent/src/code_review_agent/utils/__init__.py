@@ -2,8 +2,10 @@
 
 from .pr_loader import (
     fetch_pr_data,
+    afetch_pr_data,
     format_pr_for_review,
     download_and_format_pr,
+    adownload_and_format_pr,
 )
 from .github_tools import (
     get_file_contents,
@@ -12,8 +14,10 @@ from .github_tools import (
 
 __all__ = [
     "fetch_pr_data",
+    "afetch_pr_data",
     "format_pr_for_review",
     "download_and_format_pr",
+    "adownload_and_format_pr",
     "get_file_contents",
     "build_github_tools",
 ]
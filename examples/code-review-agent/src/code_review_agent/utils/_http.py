@@ -0,0 +1,24 @@
+"""Shared HTTP clients for GitHub REST calls."""
+
+import httpx
+
+_CLIENT_OPTIONS = dict(
+    http2=True,
+    timeout=httpx.Timeout(30.0),
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    follow_redirects=True,
+)
+
+# One pooled HTTP/2 client per process: repeated GitHub calls reuse the same
+# TLS connection instead of handshaking on every request.
+CLIENT = httpx.Client(**_CLIENT_OPTIONS)
+
+
+def async_client() -> httpx.AsyncClient:
+    """Return a new async client with the shared options.
+
+    Async connections belong to the event loop that opened them, so there is
+    no process-wide async pool; use it as ``async with async_client() as
+    client:`` so the connections are closed when the caller is done.
+    """
+    return httpx.AsyncClient(**_CLIENT_OPTIONS)
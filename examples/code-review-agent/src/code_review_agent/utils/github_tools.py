@@ -1,67 +1,128 @@
 """GitHub API tools for code review agent."""
 
+import base64
+import hashlib
 import os
+import threading
+import time
+from collections import OrderedDict
 from typing import Optional
-import requests
 import dspy
 
+from code_review_agent.utils._http import CLIENT
+
+CONTENTS_CACHE_TTL = 300.0  # seconds before a cached entry is revalidated
+CONTENTS_CACHE_MAXSIZE = 2048
+
+# (owner, repo, api_path, token_digest) -> (fetched_at, etag, last_modified, contents)
+_contents_cache: "OrderedDict[tuple, tuple[float, Optional[str], Optional[str], str]]" = OrderedDict()
+_contents_cache_lock = threading.Lock()
+
+
+def _format_contents(path: str, data) -> str:
+    """Render a contents API response as text for the agent."""
+    # Handle directory listing
+    if isinstance(data, list):
+        files = [f"{item['name']}/" if item['type'] == 'dir' else item['name'] for item in data]
+        return f"Directory listing for {path}:\n" + "\n".join(files)
+
+    # Handle file content
+    if data.get('type') == 'file':
+        return base64.b64decode(data['content']).decode('utf-8')
+
+    return f"Unknown content type: {data.get('type')}"
+
 
 def get_file_contents(owner: str, repo: str, path: str, github_token: Optional[str] = None) -> str:
     """
     Get file or directory contents from a GitHub repository.
-    
+
+    Responses are cached for CONTENTS_CACHE_TTL seconds. After that the entry is
+    revalidated with If-None-Match / If-Modified-Since; a 304 reply reuses the
+    cached text and does not count against GitHub's primary rate limit.
+
     Args:
         owner: Repository owner (username or organization)
         repo: Repository name
         path: Path to file/directory (directories must end with a slash '/')
-    
+
     Returns:
         File contents as string or directory listing
     """
     if github_token is None:
         github_token = os.getenv("GITHUB_TOKEN")
-    
+
     # Remove trailing slash for API call
     api_path = path.rstrip('/')
-    
+
+    token_digest = hashlib.sha256(github_token.encode()).hexdigest() if github_token else None
+    cache_key = (owner, repo, api_path, token_digest)
+
+    with _contents_cache_lock:
+        cached = _contents_cache.get(cache_key)
+        if cached is not None:
+            _contents_cache.move_to_end(cache_key)
+
+    if cached is not None and time.monotonic() - cached[0] < CONTENTS_CACHE_TTL:
+        return cached[3]
+
     url = f"https://api.github.com/repos/{owner}/{repo}/contents/{api_path}"
-    headers = {"Accept": "application/vnd.github.v3+json"}
-    
+    # Directories need the JSON listing; files come back as the raw body, so
+    # there is no JSON envelope to parse and no base64 to decode.
+    if path.endswith('/'):
+        headers = {"Accept": "application/vnd.github.v3+json"}
+    else:
+        headers = {"Accept": "application/vnd.github.raw+json"}
+
     if github_token:
         headers["Authorization"] = f"token {github_token}"
-    
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    
-    data = response.json()
-    
-    # Handle directory listing
-    if isinstance(data, list):
-        files = [f"{item['name']}/" if item['type'] == 'dir' else item['name'] for item in data]
-        return f"Directory listing for {path}:\n" + "\n".join(files)
-    
-    # Handle file content
-    if data.get('type') == 'file':
-        import base64
-        content = base64.b64decode(data['content']).decode('utf-8')
-        return content
-    
-    return f"Unknown content type: {data.get('type')}"
+
+    if cached is not None:
+        _, etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = CLIENT.get(url, headers=headers)
+
+    if response.status_code == 304 and cached is not None:
+        contents = cached[3]
+    else:
+        response.raise_for_status()
+        if response.headers.get("Content-Type", "").startswith("application/json"):
+            # Directory requested without a trailing slash: GitHub still answers with JSON
+            contents = _format_contents(path, response.json())
+        else:
+            contents = response.text
+
+    with _contents_cache_lock:
+        _contents_cache[cache_key] = (
+            time.monotonic(),
+            response.headers.get("ETag") or (cached[1] if cached else None),
+            response.headers.get("Last-Modified") or (cached[2] if cached else None),
+            contents,
+        )
+        _contents_cache.move_to_end(cache_key)
+        while len(_contents_cache) > CONTENTS_CACHE_MAXSIZE:
+            _contents_cache.popitem(last=False)
+
+    return contents
 
 
 def build_github_tools(github_token: Optional[str] = None) -> list[dspy.Tool]:
     """
     Build DSPy tools for GitHub API operations.
-    
+
     Args:
         github_token: Optional GitHub token (uses GITHUB_TOKEN env var if not provided)
-    
+
     Returns:
         List of DSPy tools
     """
     def get_file_wrapper(owner: str, repo: str, path: str) -> str:
         return get_file_contents(owner, repo, path, github_token)
-    
+
     return [
         dspy.Tool(
             func=get_file_wrapper,
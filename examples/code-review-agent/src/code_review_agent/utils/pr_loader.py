@@ -1,41 +1,72 @@
 """Utilities for loading and parsing PR data from GitHub."""
 
+import asyncio
+import copy
+import logging
 import os
 import re
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Tuple, Optional
-import requests
+
+import httpx
 
 from code_review_agent.signatures.review_pr import FilePatchInfo, EditType
+from code_review_agent.utils._http import CLIENT, async_client
 
+logger = logging.getLogger(__name__)
 
-def fetch_pr_data(repo: str, pr_number: int, github_token: Optional[str] = None) -> Dict:
-    """
-    Fetch PR metadata and files from GitHub API.
-    
-    Args:
-        repo: Repository in format "owner/repo"
-        pr_number: Pull request number
-        github_token: Optional GitHub personal access token for higher rate limits
-        
-    Returns:
-        Dict with PR metadata
-    """
-    base_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
-    
+# Splits a unified diff into hunks (sections starting with @@)
+_HUNK_RE = re.compile(
+    r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@([^\n]*)\n(.*?)(?=\n@@|\Z)',
+    re.DOTALL,
+)
+
+FORMATTED_PR_CACHE_MAXSIZE = 256
+
+# GitHub's maximum page size for the pull request files endpoint
+FILES_PER_PAGE = 100
+
+_LANGUAGE_MAP = {
+    "py": "Python",
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "java": "Java",
+    "cpp": "C++",
+    "c": "C",
+    "go": "Go",
+    "rs": "Rust",
+    "rb": "Ruby",
+    "php": "PHP",
+    "md": "Markdown"
+}
+
+# (repo, pr_number, head_sha, github_token) -> formatted PR data
+_formatted_pr_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
+_formatted_pr_cache_lock = threading.Lock()
+
+
+def _github_headers(github_token: Optional[str]) -> Dict[str, str]:
     headers = {"Accept": "application/vnd.github.v3+json"}
     if github_token:
         headers["Authorization"] = f"token {github_token}"
-    
-    # Fetch PR metadata
-    pr_response = requests.get(base_url, headers=headers)
-    pr_response.raise_for_status()
-    pr_data = pr_response.json()
-    
-    # Fetch PR files
-    files_response = requests.get(f"{base_url}/files", headers=headers)
-    files_response.raise_for_status()
-    files_data = files_response.json()
-    
+    return headers
+
+
+def _files_page_params(page: int) -> Dict[str, int]:
+    return {"per_page": FILES_PER_PAGE, "page": page}
+
+
+def _last_files_page(response: httpx.Response) -> int:
+    """Read the total page count from the Link header of the first files page."""
+    last = response.links.get("last")
+    if not last:
+        return 1
+    return int(httpx.URL(last["url"]).params.get("page", 1))
+
+
+def _summarize_pr(pr_data: Dict, files_data: List[Dict]) -> Dict:
+    """Reduce the raw pull and files API responses to the fields we use."""
     # Check if PR is from a fork
     head_repo = pr_data["head"]["repo"]
     base_repo = pr_data["base"]["repo"]
@@ -59,7 +90,80 @@ def fetch_pr_data(repo: str, pr_number: int, github_token: Optional[str] = None)
     }
 
 
-def parse_patch_to_hunks(patch: str, filename: str) -> Tuple[str, List[Dict]]:
+def fetch_pr_data(repo: str, pr_number: int, github_token: Optional[str] = None) -> Dict:
+    """
+    Fetch PR metadata and files from GitHub API.
+    
+    Args:
+        repo: Repository in format "owner/repo"
+        pr_number: Pull request number
+        github_token: Optional GitHub personal access token for higher rate limits
+        
+    Returns:
+        Dict with PR metadata
+    """
+    base_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
+    headers = _github_headers(github_token)
+    
+    # Fetch PR metadata
+    pr_response = CLIENT.get(base_url, headers=headers)
+    pr_response.raise_for_status()
+    pr_data = pr_response.json()
+    
+    # Fetch PR files, one page at a time
+    files_url = f"{base_url}/files"
+    files_response = CLIENT.get(files_url, headers=headers, params=_files_page_params(1))
+    files_response.raise_for_status()
+    files_data = files_response.json()
+    for page in range(2, _last_files_page(files_response) + 1):
+        page_response = CLIENT.get(files_url, headers=headers, params=_files_page_params(page))
+        page_response.raise_for_status()
+        files_data.extend(page_response.json())
+    
+    return _summarize_pr(pr_data, files_data)
+
+
+async def afetch_pr_data(repo: str, pr_number: int, github_token: Optional[str] = None) -> Dict:
+    """
+    Async variant of fetch_pr_data.
+    
+    The PR and first files page are requested concurrently over one HTTP/2
+    connection, which is closed before returning; once the first page reports how many pages there are,
+    the rest are requested concurrently as well.
+    
+    Args:
+        repo: Repository in format "owner/repo"
+        pr_number: Pull request number
+        github_token: Optional GitHub personal access token for higher rate limits
+        
+    Returns:
+        Dict with PR metadata
+    """
+    base_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
+    headers = _github_headers(github_token)
+    files_url = f"{base_url}/files"
+    
+    async with async_client() as client:
+        pr_response, files_response = await asyncio.gather(
+            client.get(base_url, headers=headers),
+            client.get(files_url, headers=headers, params=_files_page_params(1)),
+        )
+        pr_response.raise_for_status()
+        files_response.raise_for_status()
+        files_data = files_response.json()
+        
+        page_responses = await asyncio.gather(*(
+            client.get(files_url, headers=headers, params=_files_page_params(page))
+            for page in range(2, _last_files_page(files_response) + 1)
+        ))
+    for page_response in page_responses:
+        page_response.raise_for_status()
+        files_data.extend(page_response.json())
+    
+    return _summarize_pr(pr_response.json(), files_data)
+
+
+def parse_patch_to_hunks(patch: str, filename: str) -> Tuple[str, List[Dict], int, int]:
     """
     Convert unified diff patch to line-numbered format with __new hunk__ and __old hunk__ sections.
     
@@ -68,19 +172,17 @@ def parse_patch_to_hunks(patch: str, filename: str) -> Tuple[str, List[Dict]]:
         filename: Name of the file
         
     Returns:
-        Tuple of (formatted_patch_string, hunk_metadata_list)
+        Tuple of (formatted_patch_string, hunk_metadata_list, plus_lines, minus_lines)
     """
     if not patch:
-        return "", []
+        return "", [], 0, 0
     
-    formatted_output = f"## File: '{filename}'\n\n"
+    parts = [f"## File: '{filename}'\n\n"]
     hunks = []
+    plus_lines = 0
+    minus_lines = 0
     
-    # Split patch into hunks (sections starting with @@)
-    hunk_pattern = r'@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@([^\n]*)\n(.*?)(?=\n@@|\Z)'
-    matches = re.finditer(hunk_pattern, patch, re.DOTALL)
-    
-    for match in matches:
+    for match in _HUNK_RE.finditer(patch):
         old_start = int(match.group(1))
         old_count = int(match.group(2)) if match.group(2) else 1
         new_start = int(match.group(3))
@@ -101,21 +203,25 @@ def parse_patch_to_hunks(patch: str, filename: str) -> Tuple[str, List[Dict]]:
             if not line:
                 continue
                 
-            if line.startswith('+'):
+            first = line[0]
+            if first == '+':
                 new_hunk_lines.append(f"{new_line_num} {line}")
                 new_line_num += 1
-            elif line.startswith('-'):
+                plus_lines += 1
+            elif first == '-':
                 old_hunk_lines.append(line)
+                minus_lines += 1
             else:
                 new_hunk_lines.append(f"{new_line_num} {line}")
                 old_hunk_lines.append(line)
                 new_line_num += 1
         
-        formatted_output += f"@@ -{old_start},{old_count} +{new_start},{new_count} @@ {hunk_header}\n"
-        formatted_output += "__new hunk__\n"
-        formatted_output += '\n'.join(new_hunk_lines) + '\n'
-        formatted_output += "__old hunk__\n"
-        formatted_output += '\n'.join(old_hunk_lines) + '\n\n'
+        parts.append(f"@@ -{old_start},{old_count} +{new_start},{new_count} @@ {hunk_header}\n")
+        parts.append("__new hunk__\n")
+        parts.append('\n'.join(new_hunk_lines))
+        parts.append("\n__old hunk__\n")
+        parts.append('\n'.join(old_hunk_lines))
+        parts.append('\n\n')
         
         hunks.append({
             "old_start": old_start,
@@ -125,7 +231,7 @@ def parse_patch_to_hunks(patch: str, filename: str) -> Tuple[str, List[Dict]]:
             "header": hunk_header
         })
     
-    return formatted_output, hunks
+    return "".join(parts), hunks, plus_lines, minus_lines
 
 
 def determine_edit_type(status: str) -> EditType:
@@ -144,9 +250,17 @@ def count_lines(patch: str) -> Tuple[int, int]:
     if not patch:
         return 0, 0
     
-    lines = patch.split('\n')
-    plus_lines = sum(1 for line in lines if line.startswith('+') and not line.startswith('+++'))
-    minus_lines = sum(1 for line in lines if line.startswith('-') and not line.startswith('---'))
+    plus_lines = minus_lines = 0
+    for line in patch.split('\n'):
+        if not line:
+            continue
+        first = line[0]
+        if first == '+':
+            if not line.startswith('+++'):
+                plus_lines += 1
+        elif first == '-':
+            if not line.startswith('---'):
+                minus_lines += 1
     return plus_lines, minus_lines
 
 
@@ -161,33 +275,19 @@ def format_pr_for_review(pr_data: Dict) -> Dict:
         Dict with pr_metadata and List[FilePatchInfo]
     """
     formatted_files: List[FilePatchInfo] = []
-    full_diff = ""
+    full_diff_parts: List[str] = []
     
     for file in pr_data["files"]:
         filename = file["filename"]
         patch = file.get("patch", "")
         
-        formatted_patch, hunks = parse_patch_to_hunks(patch, filename)
-        full_diff += formatted_patch
-        
-        plus_lines, minus_lines = count_lines(patch)
+        # Counts come from the same pass that formats the hunks
+        formatted_patch, hunks, plus_lines, minus_lines = parse_patch_to_hunks(patch, filename)
+        full_diff_parts.append(formatted_patch)
         
         # Determine language from extension
-        ext = filename.split('.')[-1] if '.' in filename else ""
-        language_map = {
-            "py": "Python",
-            "js": "JavaScript",
-            "ts": "TypeScript",
-            "java": "Java",
-            "cpp": "C++",
-            "c": "C",
-            "go": "Go",
-            "rs": "Rust",
-            "rb": "Ruby",
-            "php": "PHP",
-            "md": "Markdown"
-        }
-        language = language_map.get(ext, ext.upper() if ext else None)
+        ext = filename.rpartition('.')[2] if '.' in filename else ""
+        language = _LANGUAGE_MAP.get(ext, ext.upper() if ext else None)
         
         file_patch = FilePatchInfo(
             filename=filename,
@@ -221,17 +321,57 @@ def format_pr_for_review(pr_data: Dict) -> Dict:
             "author": pr_data["user"]
         },
         "files": formatted_files,
-        "full_diff": full_diff,
+        "full_diff": "".join(full_diff_parts),
         "num_files": len(formatted_files),
         "total_additions": sum(f.num_plus_lines for f in formatted_files),
         "total_deletions": sum(f.num_minus_lines for f in formatted_files)
     }
 
 
+def _cached_formatted_pr(key: Optional[tuple]) -> Optional[Dict]:
+    """Look up formatted PR data memoized per head commit.
+
+    head_sha is part of the cache key only: a new push changes the SHA and
+    therefore misses the cache, so reviews never see stale diffs.
+
+    Returns a deep copy, so callers may mutate the result freely.
+    """
+    if key is None:
+        return None
+    with _formatted_pr_cache_lock:
+        formatted = _formatted_pr_cache.get(key)
+        if formatted is not None:
+            _formatted_pr_cache.move_to_end(key)
+    return copy.deepcopy(formatted)
+
+
+def _store_formatted_pr(key: Optional[tuple], formatted: Dict) -> None:
+    if key is None:
+        return
+    # Keep a private copy; the caller gets the original back
+    formatted = copy.deepcopy(formatted)
+    with _formatted_pr_cache_lock:
+        _formatted_pr_cache[key] = formatted
+        _formatted_pr_cache.move_to_end(key)
+        while len(_formatted_pr_cache) > FORMATTED_PR_CACHE_MAXSIZE:
+            _formatted_pr_cache.popitem(last=False)
+
+
+def _log_loaded_pr(formatted: Dict) -> None:
+    logger.info(
+        "Loaded PR: %s (%d files, +%d -%d)",
+        formatted['pr_metadata']['title'],
+        formatted['num_files'],
+        formatted['total_additions'],
+        formatted['total_deletions'],
+    )
+
+
 def download_and_format_pr(
     repo: str = "stanfordnlp/dspy",
     pr_number: int = 8902,
-    github_token: Optional[str] = None
+    github_token: Optional[str] = None,
+    head_sha: Optional[str] = None,
 ) -> Dict:
     """
     Load a demo PR for testing.
@@ -240,6 +380,8 @@ def download_and_format_pr(
         repo: GitHub repository (default: stanfordnlp/dspy)
         pr_number: PR number (default: 8902)
         github_token: Optional GitHub token (will use GITHUB_TOKEN env var if not provided)
+        head_sha: Optional head commit SHA; when given, results are cached per
+            (repo, pr_number, head_sha) so retries and re-reviews skip the fetch
         
     Returns:
         Formatted PR data ready for review
@@ -247,14 +389,46 @@ def download_and_format_pr(
     if github_token is None:
         github_token = os.getenv("GITHUB_TOKEN")
     
-    print(f"Fetching PR #{pr_number} from {repo}...")
-    pr_data = fetch_pr_data(repo, pr_number, github_token)
+    cache_key = (repo, pr_number, head_sha, github_token) if head_sha else None
+    formatted = _cached_formatted_pr(cache_key)
+    if formatted is None:
+        logger.info("Fetching PR #%s from %s", pr_number, repo)
+        formatted = format_pr_for_review(fetch_pr_data(repo, pr_number, github_token))
+        _store_formatted_pr(cache_key, formatted)
+    
+    _log_loaded_pr(formatted)
+    
+    return formatted
+
+
+async def adownload_and_format_pr(
+    repo: str,
+    pr_number: int,
+    github_token: Optional[str] = None,
+    head_sha: Optional[str] = None,
+) -> Dict:
+    """
+    Async variant of download_and_format_pr; shares its per-head_sha cache.
+    
+    Args:
+        repo: GitHub repository in format "owner/repo"
+        pr_number: PR number
+        github_token: Optional GitHub token (will use GITHUB_TOKEN env var if not provided)
+        head_sha: Optional head commit SHA used as the cache key
+        
+    Returns:
+        Formatted PR data ready for review
+    """
+    if github_token is None:
+        github_token = os.getenv("GITHUB_TOKEN")
     
-    print(f"Processing {len(pr_data['files'])} files...")
-    formatted = format_pr_for_review(pr_data)
+    cache_key = (repo, pr_number, head_sha, github_token) if head_sha else None
+    formatted = _cached_formatted_pr(cache_key)
+    if formatted is None:
+        logger.info("Fetching PR #%s from %s", pr_number, repo)
+        formatted = format_pr_for_review(await afetch_pr_data(repo, pr_number, github_token))
+        _store_formatted_pr(cache_key, formatted)
     
-    print(f"✓ Loaded PR: {formatted['pr_metadata']['title']}")
-    print(f"  Files changed: {formatted['num_files']}")
-    print(f"  +{formatted['total_additions']} -{formatted['total_deletions']}")
+    _log_loaded_pr(formatted)
     
     return formatted
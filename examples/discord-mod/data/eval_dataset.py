@@ -2,20 +2,29 @@
 Evaluation dataset loader for the Discord job posting classifier.
 """
 
+import functools
 import json
+from collections import Counter
 from pathlib import Path
 
 import dspy
 
+try:
+    # orjson is optional; fall back to the stdlib parser when it isn't installed
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
-def get_eval_dataset() -> list[dspy.Example]:
-    """Load evaluation dataset from JSONL file."""
+
+@functools.lru_cache(maxsize=1)
+def _load_eval_dataset() -> tuple[dspy.Example, ...]:
+    """Parse the JSONL file once per process."""
     dataset_path = Path(__file__).parent / "eval_dataset.jsonl"
 
     examples = []
-    with open(dataset_path) as f:
+    with open(dataset_path, "rb") as f:
         for line in f:
-            data = json.loads(line)
+            data = _json_loads(line)
             example = dspy.Example(
                 message=data["message"],
                 author=data["author"],
@@ -26,22 +35,27 @@ def get_eval_dataset() -> list[dspy.Example]:
             ).with_inputs("message", "author", "channel_name")
             examples.append(example)
 
-    return examples
+    return tuple(examples)
+
+
+def get_eval_dataset() -> list[dspy.Example]:
+    """Load evaluation dataset from JSONL file."""
+    return list(_load_eval_dataset())
 
 
 def get_dataset_by_category(category: str) -> list[dspy.Example]:
     """Return examples filtered by category."""
-    return [ex for ex in get_eval_dataset() if ex.category == category]
+    return [ex for ex in _load_eval_dataset() if ex.category == category]
 
 
 def get_dataset_stats() -> dict:
     """Return statistics about the dataset."""
-    from collections import Counter
-
-    dataset = get_eval_dataset()
-    categories = Counter(ex.category for ex in dataset)
-    intents = Counter(ex.intent for ex in dataset)
-    actions = Counter(ex.action for ex in dataset)
+    dataset = _load_eval_dataset()
+    categories, intents, actions = Counter(), Counter(), Counter()
+    for ex in dataset:
+        categories[ex.category] += 1
+        intents[ex.intent] += 1
+        actions[ex.action] += 1
 
     return {
         "total": len(dataset),
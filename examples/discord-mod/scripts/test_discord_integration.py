@@ -30,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max Discord moderation actions in flight at once
+MAX_ACTIONS = 8
+
 # Mocked LLM responses - maps message content patterns to outputs
 MOCK_CLASSIFICATIONS = {
     "hiring": {"intent": "post_job", "action": "move", "reason": "Job posting in general channel"},
@@ -62,16 +65,20 @@ async def main():
     from discord_mod.gateways.job_posting_gateway import JobPostingGateway
     
     gateway = JobPostingGateway()
+    gateway.setup()
 
     # Test 1: Fetch messages
     logger.info("\n[TEST 1] Fetching messages...")
     inputs_list = await gateway.get_pipeline_inputs()
     logger.info(f"Fetched {len(inputs_list)} messages")
 
-    # Export to JSON for inspection
-    output_file = f"fetched_messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    # Export to JSONL for inspection, one message per line, so large fetches
+    # are serialized incrementally instead of as one pretty-printed string
+    output_file = f"fetched_messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(inputs_list, f, indent=2, ensure_ascii=False)
+        for inputs in inputs_list:
+            f.write(json.dumps(inputs, ensure_ascii=False))
+            f.write("\n")
     logger.info(f"Exported messages to {output_file}")
     
     if not inputs_list:
@@ -80,19 +87,28 @@ async def main():
 
     # Test 2: Process each message with mocked LLM
     logger.info("\n[TEST 2] Processing messages with mocked classifier...")
-    for i, inputs in enumerate(inputs_list, 1):
-        logger.info(f"\n--- Message {i}/{len(inputs_list)} ---")
-        logger.info(f"Author: {inputs['author']}")
-        logger.info(f"Channel: {inputs['channel_name']}")
-        logger.info(f"Message: {inputs['message'][:80]}...")
-        
+    # Bounded so concurrent actions stay under Discord's per-route rate limits
+    sem = asyncio.Semaphore(MAX_ACTIONS)
+
+    async def process(i: int, inputs: dict) -> None:
         # Mock the LLM classification
         output = mock_classify(inputs["message"])
-        logger.info(f"[MOCKED] Intent: {output['intent']}, Action: {output['action']}")
-        logger.info(f"[MOCKED] Reason: {output['reason']}")
+        logger.info(
+            f"\n--- Message {i}/{len(inputs_list)} ---\n"
+            f"Author: {inputs['author']}\n"
+            f"Channel: {inputs['channel_name']}\n"
+            f"Message: {inputs['message'][:80]}...\n"
+            f"[MOCKED] Intent: {output['intent']}, Action: {output['action']}\n"
+            f"[MOCKED] Reason: {output['reason']}"
+        )
 
         # Test 3: Execute action (respects DRY_RUN)
-        await gateway.on_complete(inputs, output)
+        async with sem:
+            await gateway.on_complete(inputs, output)
+
+    await asyncio.gather(*(process(i, inputs) for i, inputs in enumerate(inputs_list, 1)))
+    # Finishes queued deletes and dry-run audits, then closes the Discord connection pool
+    await gateway.aclose()
 
     # Test 4: Summary
     logger.info("\n" + "=" * 60)
@@ -38,6 +38,7 @@ async def main():
 
     # Create instances
     gateway = JobPostingGateway()
+    gateway.setup()
     classifier = ClassifyJobPosting()
 
     logger.info("=" * 60)
@@ -68,6 +69,9 @@ async def main():
         # Log what would happen (dry run)
         await gateway.on_complete(inputs, output)
 
+    # Finishes queued deletes and dry-run audits, then closes the Discord connection pool
+    await gateway.aclose()
+
     logger.info("\n" + "=" * 60)
     logger.info("Dry run complete - no Discord actions were taken")
     logger.info("=" * 60)
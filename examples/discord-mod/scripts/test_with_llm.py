@@ -21,6 +21,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Max classifications in flight at once
+MAX_CONCURRENCY = 16
+# Max Discord moderation actions in flight at once
+MAX_ACTIONS = 8
+
+
+def _dedupe_key(inputs: dict) -> tuple[str, str, str]:
+    return inputs["message"], inputs["author"], inputs["channel_name"]
+
 
 async def main():
     import dspy
@@ -43,6 +52,7 @@ async def main():
     logger.info("=" * 60)
 
     gateway = JobPostingGateway()
+    gateway.setup()
     classifier = ClassifyJobPosting()
 
     # Fetch messages
@@ -51,45 +61,77 @@ async def main():
     logger.info(f"Fetched {len(inputs_list)} messages")
 
     # Export
-    output_file = f"classified_messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    results = []
-
-    for i, inputs in enumerate(inputs_list, 1):
-        logger.info(f"\n--- Message {i}/{len(inputs_list)} ---")
-        logger.info(f"Author: {inputs['author']}")
-        logger.info(f"Message: {inputs['message'][:100]}...")
-
-        # Real LLM classification
-        result = classifier(
-            message=inputs["message"],
-            author=inputs["author"],
-            channel_name=inputs["channel_name"],
+    output_file = f"classified_messages_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+
+    # Stage 1: classify each distinct message once through DSPy's threaded
+    # batch runner; identical (message, author, channel) triples render the
+    # same prompt, so their prediction is shared
+    unique: dict[tuple[str, str, str], int] = {}
+    for inputs in inputs_list:
+        unique.setdefault(_dedupe_key(inputs), len(unique))
+
+    examples = [
+        dspy.Example(
+            message=message,
+            author=author,
+            channel_name=channel_name,
+        ).with_inputs("message", "author", "channel_name")
+        for message, author, channel_name in unique
+    ]
+    unique_predictions = await asyncio.to_thread(
+        classifier.batch, examples, num_threads=MAX_CONCURRENCY
+    )
+    predictions = [unique_predictions[unique[_dedupe_key(inputs)]] for inputs in inputs_list]
+    if len(examples) < len(inputs_list):
+        logger.info(f"Classified {len(examples)} unique messages for {len(inputs_list)} inputs")
+
+    # Stage 2: execute Discord actions concurrently, bounded to stay under
+    # Discord's per-route rate limits
+    sem = asyncio.Semaphore(MAX_ACTIONS)
+    actions: dict[str, int] = {}
+
+    async def act(i: int, inputs: dict, prediction) -> None:
+        if prediction is None:
+            # Leave it unprocessed; the gateway keeps its cursor before it so
+            # the next run fetches and retries it
+            logger.warning(f"Message {i}/{len(inputs_list)}: classification failed, skipping")
+            await gateway.on_error(inputs, RuntimeError("classification failed"))
+            record(inputs, {})
+            return
+
+        output = prediction.toDict()
+        logger.info(
+            f"\n--- Message {i}/{len(inputs_list)} ---\n"
+            f"Author: {inputs['author']}\n"
+            f"Message: {inputs['message'][:100]}...\n"
+            f"[LLM] Intent: {output.get('intent')}\n"
+            f"[LLM] Action: {output.get('action')}\n"
+            f"[LLM] Reason: {output.get('reason')}"
         )
-        output = result.toDict()
-
-        logger.info(f"[LLM] Intent: {output.get('intent')}")
-        logger.info(f"[LLM] Action: {output.get('action')}")
-        logger.info(f"[LLM] Reason: {output.get('reason')}")
-
-        results.append({
-            **inputs,
-            "classification": output,
-        })
 
         # Execute action (respects DRY_RUN)
-        await gateway.on_complete(inputs, output)
+        async with sem:
+            await gateway.on_complete(inputs, output)
+
+        record(inputs, output)
 
-    # Save results
     with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+        def record(inputs: dict, output: dict) -> None:
+            # Stream each result as one JSONL line as soon as it is known
+            f.write(json.dumps({**inputs, "classification": output}, ensure_ascii=False))
+            f.write("\n")
+            action = output.get("action", "unknown")
+            actions[action] = actions.get(action, 0) + 1
+
+        await asyncio.gather(*(
+            act(i, inputs, prediction)
+            for i, (inputs, prediction) in enumerate(zip(inputs_list, predictions), 1)
+        ))
+    # Finishes queued deletes and dry-run audits, then closes the Discord connection pool
+    await gateway.aclose()
     logger.info(f"\nExported results to {output_file}")
 
     # Summary
-    actions = {}
-    for r in results:
-        action = r["classification"].get("action", "unknown")
-        actions[action] = actions.get(action, 0) + 1
-
     logger.info("\n" + "=" * 60)
     logger.info("Summary:")
     for action, count in sorted(actions.items()):
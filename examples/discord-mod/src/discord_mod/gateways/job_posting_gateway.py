@@ -8,17 +8,124 @@ The pipeline module (ClassifyJobPosting) stays pure - it only knows about
 message content, not Discord API details.
 """
 
+import asyncio
+import functools
 import logging
 import os
-from typing import Any, Dict, List
+import re
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from dspy_cli.gateway import CronGateway, PipelineOutput
 
+from discord_mod.utils.cursor_store import ChannelCursorStore
 from discord_mod.utils.discord_client import DiscordClient
 from discord_mod.utils.processed_store import ProcessedMessageStore
 
 logger = logging.getLogger(__name__)
 
+# Anything that could be a job post, job seeking, spam or a link goes to the
+# classifier; short messages matching none of these are ordinary chat.
+_ESCALATE_RE = re.compile(
+    r"\b(?:hir(?:e|es|ed|ing)|looking for (?:work|a job|a role)|remote|salary|contract|"
+    r"freelanc\w*|consult\w*|services?|available|opportunit\w*|dm me|jobs?|apply|resume|cv|"
+    r"portfolio|crypto\w*|blockchain|nfts?|web3|airdrop)\b"
+    r"|\$\s?\d|https?://",
+    re.IGNORECASE,
+)
+# Long messages can be self-promotional introductions; always classify them
+_PREFILTER_MAX_LEN = 140
+
+# Shared read-only default for messages without an author object
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Discord rejects message content longer than this
+_DISCORD_MAX_LEN = 2000
+# Max queued dry-run audit entries packed into one audit message
+_AUDIT_BATCH_SIZE = 20
+# Failed classifications of one message before it is skipped, so a message
+# that always fails can't hold its channel's cursor back forever
+_MAX_CLASSIFY_ATTEMPTS = 3
+
+
+def _is_plain_chat(content: str) -> bool:
+    """Return True if the message can be allowed without asking the classifier."""
+    return len(content) < _PREFILTER_MAX_LEN and not _ESCALATE_RE.search(content)
+
+
+_REQUIRED_ENV = (
+    "DISCORD_BOT_TOKEN",
+    "DISCORD_CHANNEL_IDS",
+    "DISCORD_JOBS_CHANNEL_ID",
+    "DISCORD_AUDIT_CHANNEL_ID",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GatewayConfig:
+    """Validated gateway settings read from the environment."""
+
+    token: str
+    channel_ids: Tuple[str, ...]
+    jobs_channel_id: str
+    audit_channel_id: str
+    dry_run: bool
+    prefilter: bool
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config() -> GatewayConfig:
+    """Read and validate the environment once per process.
+
+    Raises RuntimeError if a required variable is missing; failures are not
+    cached, so a later call sees a fixed environment.
+    """
+    env = os.environ
+    missing = [name for name in _REQUIRED_ENV if not env.get(name)]
+    if missing:
+        msg = f"Missing required environment variables: {', '.join(missing)}"
+        logger.error(msg)
+        raise RuntimeError(msg)
+
+    return GatewayConfig(
+        token=env["DISCORD_BOT_TOKEN"],
+        channel_ids=tuple(c.strip() for c in env["DISCORD_CHANNEL_IDS"].split(",") if c.strip()),
+        jobs_channel_id=env["DISCORD_JOBS_CHANNEL_ID"],
+        audit_channel_id=env["DISCORD_AUDIT_CHANNEL_ID"],
+        dry_run=env.get("DRY_RUN", "false").lower() == "true",
+        prefilter=env.get("PREFILTER", "true").lower() == "true",
+    )
+
+
+@dataclass(slots=True)
+class Moderation:
+    """One classified message, unpacked once from the pipeline inputs and output."""
+
+    message_id: Optional[str]
+    channel_id: Optional[str]
+    author_id: Optional[str]
+    author: str
+    message: str
+    action: str
+    intent: str
+    reason: str
+
+    @classmethod
+    def from_result(cls, inputs: Dict[str, Any], output: PipelineOutput) -> "Moderation":
+        meta = inputs.get("_meta") or _EMPTY
+        return cls(
+            message_id=meta.get("message_id"),
+            channel_id=meta.get("channel_id"),
+            author_id=meta.get("author_id"),
+            author=inputs.get("author", "unknown"),
+            message=inputs.get("message", ""),
+            action=output.get("action", "allow"),
+            intent=output.get("intent", "other"),
+            reason=output.get("reason", ""),
+        )
+
 
 class JobPostingGateway(CronGateway):
     """Poll Discord channels and moderate job postings.
@@ -27,43 +134,66 @@ class JobPostingGateway(CronGateway):
         DISCORD_BOT_TOKEN: Bot authentication token
         DISCORD_CHANNEL_IDS: Comma-separated channel IDs to monitor
         DISCORD_JOBS_CHANNEL_ID: Channel ID to move job posts to
+        DISCORD_AUDIT_CHANNEL_ID: Channel ID for moderation audit logs
         DRY_RUN: Set to "true" to log actions without executing them
+        PREFILTER: Set to "false" to send every message to the classifier
     """
 
     schedule = "*/5 * * * *"  # Every 5 minutes
 
+    _ACTION_EMOJI = {"move": "📦", "flag": "⚠️", "delete": "🗑️"}
+    _AUDIT_TEMPLATE = (
+        "{prefix}{emoji} **Action: {action}**\n"
+        "**Author:** {author}\n"
+        "**Channel:** <#{channel_id}>\n"
+        "**Intent:** {intent}\n"
+        "**Reason:** {reason}\n"
+        "**Message:** {message}\n"
+        "**Message ID:** {message_id}"
+    )
+    _MOVED_TEMPLATE = "**Moved from <#{channel_id}>**\n*Originally posted by {author}:*\n\n{message}"
+
     def __init__(self):
+        self.config: GatewayConfig | None = None
+        # Read the kill switch up front so a gateway used before setup()
+        # still honours DRY_RUN; setup() re-reads it with the rest of the config
         self.dry_run = os.environ.get("DRY_RUN", "false").lower() == "true"
+        self.prefilter = True
         self.client: DiscordClient | None = None
-        self.channel_ids: List[str] = []
+        self.channel_ids: Tuple[str, ...] = ()
         self.jobs_channel_id: str | None = None
         self.audit_channel_id: str | None = None
         self.processed_store: ProcessedMessageStore | None = None
+        self.cursors: ChannelCursorStore | None = None
+        # channel_id -> (message_id, needs_processing) fetched this tick and
+        # not yet behind the saved cursor, oldest first
+        self._uncommitted: Dict[str, deque[Tuple[str, bool]]] = {}
+        # message_id -> failed classification attempts so far
+        self._failures: Dict[str, int] = {}
+        # Dry-run audit entries, sent in bulk by flush_audit()
+        self._pending_audit: List[str] = []
+        # channel_id -> moved or deleted messages awaiting flush_deletes()
+        self._pending_deletes: Dict[str, List[Moderation]] = {}
+        # Inputs from the current tick still awaiting on_complete/on_error, and
+        # the message IDs already counted; the scheduler may report one input
+        # twice (on_error after a failed on_complete)
+        self._tick_pending = 0
+        self._tick_settled: Set[str] = set()
 
     def setup(self) -> None:
         """Validate configuration and create Discord client."""
-        missing = []
-        if not os.environ.get("DISCORD_BOT_TOKEN"):
-            missing.append("DISCORD_BOT_TOKEN")
-        if not os.environ.get("DISCORD_CHANNEL_IDS"):
-            missing.append("DISCORD_CHANNEL_IDS")
-        if not os.environ.get("DISCORD_JOBS_CHANNEL_ID"):
-            missing.append("DISCORD_JOBS_CHANNEL_ID")
-        if not os.environ.get("DISCORD_AUDIT_CHANNEL_ID"):
-            missing.append("DISCORD_AUDIT_CHANNEL_ID")
-        
-        if missing:
-            msg = f"Missing required environment variables: {', '.join(missing)}"
-            logger.error(msg)
-            raise RuntimeError(msg)
-
-        self.client = DiscordClient(
-            token=os.environ.get("DISCORD_BOT_TOKEN", ""),
-        )
-        self.channel_ids = os.environ.get("DISCORD_CHANNEL_IDS", "").split(",")
-        self.jobs_channel_id = os.environ.get("DISCORD_JOBS_CHANNEL_ID")
-        self.audit_channel_id = os.environ.get("DISCORD_AUDIT_CHANNEL_ID")
+        config = self.config = _load_config()
+
+        self.dry_run = config.dry_run
+        self.prefilter = config.prefilter
+        self.client = DiscordClient(token=config.token)
+        self.channel_ids = config.channel_ids
+        self.jobs_channel_id = config.jobs_channel_id
+        self.audit_channel_id = config.audit_channel_id
         self.processed_store = ProcessedMessageStore()
+        self.cursors = ChannelCursorStore(
+            self.processed_store.path.with_name("channel_cursors.json")
+        )
         
         if self.dry_run:
             logger.info("DRY_RUN mode - actions will be logged, not executed")
@@ -73,137 +203,285 @@ class JobPostingGateway(CronGateway):
         if self.processed_store:
             self.processed_store.flush()
 
+    async def aclose(self) -> None:
+        """Finish queued deletes and dry-run audits, then close the Discord client's connection pool.
+
+        The server calls this on its event loop after shutdown().
+        """
+        if self.client:
+            await self.flush_deletes()
+            await self.flush_audit()
+            await self.client.aclose()
+            self.client = None
+
     async def get_pipeline_inputs(self) -> List[Dict[str, Any]]:
         """Fetch recent unprocessed messages from monitored channels."""
         assert self.client is not None, "setup() must be called before get_pipeline_inputs()"
-        inputs = []
+        # Finish deletes and dry-run audits left over by an interrupted tick
+        await self.flush_deletes()
+        await self.flush_audit()
 
-        for channel_id in self.channel_ids:
-            if not channel_id.strip():
-                continue
-
-            messages = await self.client.get_recent_messages(
-                channel_id=channel_id.strip(),
-                limit=20,
-            )
+        inputs = []
+        prefiltered = 0
+
+        # Fetch all channels concurrently; each is an independent round-trip.
+        # Only messages newer than the channel's cursor are requested.
+        results = await self.client.get_recent_messages_multi(
+            self.channel_ids,
+            limit=20,
+            after={channel_id: self.cursors.get(channel_id) for channel_id in self.channel_ids},
+        )
 
-            for msg in messages:
-                if msg.get("author", {}).get("bot", False):
+        for channel_id, messages in results.items():
+            # Everything after the cursor is refetched each tick, so this
+            # replaces whatever the previous tick left unsettled
+            uncommitted = self._uncommitted[channel_id] = deque()
+            for msg in sorted(messages, key=lambda msg: int(msg["id"])):
+                author = msg.get("author") or _EMPTY
+                if author.get("bot"):
+                    uncommitted.append((msg["id"], False))
                     continue
-                
+
+                uncommitted.append((msg["id"], True))
                 if self.processed_store.is_processed(msg["id"]):
                     continue
 
+                if self.prefilter and _is_plain_chat(msg["content"]):
+                    # Would be allowed anyway; skip the LLM call entirely
+                    self.processed_store.mark_processed(msg["id"])
+                    prefiltered += 1
+                    continue
+
                 inputs.append({
                     "message": msg["content"],
-                    "author": msg["author"]["username"],
+                    "author": author["username"],
                     "channel_name": msg.get("channel_name", "unknown"),
                     "_meta": {
                         "message_id": msg["id"],
-                        "channel_id": channel_id.strip(),
-                        "author_id": msg["author"]["id"],
+                        "channel_id": channel_id,
+                        "author_id": author["id"],
                     },
                 })
 
-        logger.info(f"Fetched {len(inputs)} messages to classify")
+        for channel_id in results:
+            self._commit_cursor(channel_id)
+        self._tick_pending = len(inputs)
+        self._tick_settled = set()
+        logger.info(f"Fetched {len(inputs)} messages to classify ({prefiltered} allowed by prefilter)")
         return inputs
 
+    def _commit_cursor(self, channel_id: str | None) -> None:
+        """Advance and save a channel's cursor over its leading settled messages.
+
+        The cursor only moves past a message once it is marked processed (or
+        never needed processing), so a crash or a failed classification leaves
+        the message to be fetched again on the next tick.
+        """
+        uncommitted = self._uncommitted.get(channel_id)
+        if not uncommitted:
+            return
+        while uncommitted:
+            message_id, needs_processing = uncommitted[0]
+            if needs_processing and not self.processed_store.is_processed(message_id):
+                break
+            self.cursors.advance(channel_id, message_id)
+            uncommitted.popleft()
+        self.cursors.save()
+
+    async def on_error(self, inputs: Dict[str, Any], error: Exception) -> None:
+        """Leave the failed message unprocessed so the next tick retries it.
+
+        After _MAX_CLASSIFY_ATTEMPTS failures the message is marked processed
+        and skipped, letting the channel's cursor move past it.
+        """
+        meta = inputs.get("_meta") or _EMPTY
+        message_id = meta.get("message_id")
+        if not message_id or self.processed_store.is_processed(message_id):
+            # Nothing to retry: no ID to track, or the action after a
+            # successful classification failed
+            logger.warning(f"Failed to handle message {message_id}: {error}")
+        else:
+            attempts = self._failures.get(message_id, 0) + 1
+            if attempts < _MAX_CLASSIFY_ATTEMPTS:
+                self._failures[message_id] = attempts
+                logger.warning(
+                    f"Failed to classify message {message_id} "
+                    f"(attempt {attempts}/{_MAX_CLASSIFY_ATTEMPTS}); will retry next tick: {error}"
+                )
+            else:
+                self._failures.pop(message_id, None)
+                logger.error(
+                    f"Skipping message {message_id} after {attempts} failed classification attempts: {error}"
+                )
+                self.processed_store.mark_processed(message_id)
+                self._commit_cursor(meta.get("channel_id"))
+        await self._input_settled(message_id)
+
     async def on_complete(self, inputs: Dict[str, Any], output: PipelineOutput) -> None:
         """Take moderation action based on classification result."""
-        meta = inputs.get("_meta", {})
-        message_id = meta.get("message_id")
-        channel_id = meta.get("channel_id")
-        author = inputs.get("author", "unknown")
+        meta = inputs.get("_meta") or _EMPTY
+        self._failures.pop(meta.get("message_id"), None)
+        try:
+            await self._moderate(inputs, output)
+        finally:
+            await self._input_settled(meta.get("message_id"))
+
+    async def _input_settled(self, message_id: str | None) -> None:
+        """Count one finished input; flush deletes and dry-run audits once the tick is done.
+
+        Each message is counted once, however many hooks report it.
+        """
+        if message_id is not None:
+            if message_id in self._tick_settled:
+                return
+            self._tick_settled.add(message_id)
+        self._tick_pending -= 1
+        if self._tick_pending <= 0:
+            await self.flush_deletes()
+            await self.flush_audit()
+
+    async def _moderate(self, inputs: Dict[str, Any], output: PipelineOutput) -> None:
+        """Mark the message processed and apply the classified action."""
+        if output.get("action", "allow") == "allow":
+            # The common case: record it and stop before unpacking anything else
+            meta = inputs.get("_meta") or _EMPTY
+            message_id = meta.get("message_id")
+            if message_id:
+                self.processed_store.mark_processed(message_id)
+                self._commit_cursor(meta.get("channel_id"))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Message %s from %s: intent=%s, action=allow, reason=%s",
+                    message_id, inputs.get("author", "unknown"),
+                    output.get("intent", "other"), output.get("reason", ""),
+                )
+            return
 
-        action = output.get("action", "allow")
-        intent = output.get("intent", "other")
-        reason = output.get("reason", "")
+        m = Moderation.from_result(inputs, output)
 
         logger.info(
-            f"Message {message_id} from {author}: "
-            f"intent={intent}, action={action}, reason={reason}"
+            f"Message {m.message_id} from {m.author}: "
+            f"intent={m.intent}, action={m.action}, reason={m.reason}"
         )
 
-        if message_id:
-            self.processed_store.mark_processed(message_id)
-
-        if action == "allow":
-            return
+        if m.message_id:
+            self.processed_store.mark_processed(m.message_id)
+            self._commit_cursor(m.channel_id)
 
         if self.dry_run:
-            await self._log_dry_run_action(action, inputs, output)
-            await self._send_audit_log(action, inputs, output, dry_run=True)
+            self._log_dry_run_action(m)
+            await self._send_audit_log(m, dry_run=True)
             return
 
-        if action == "move" and self.jobs_channel_id:
-            original_content = inputs["message"]
-            await self.client.send_message(
-                channel_id=self.jobs_channel_id,
-                content=f"**Moved from <#{channel_id}>**\n"
-                        f"*Originally posted by {author}:*\n\n{original_content}",
-            )
-            await self.client.delete_message(
-                channel_id=channel_id,
-                message_id=message_id,
-            )
-            await self.client.send_dm(
-                user_id=meta["author_id"],
-                content=f"Your job posting was moved to <#{self.jobs_channel_id}>. "
-                        f"Please post job-related content there in the future.",
-            )
-            logger.info(f"Moved message {message_id} to jobs channel")
-            await self._send_audit_log(action, inputs, output, dry_run=False)
+        # Each audit entry is posted only after its action succeeded, so the
+        # audit channel never reports an action that didn't happen. Moved and
+        # deleted messages are audited by flush_deletes().
+        if m.action == "move" and self.jobs_channel_id:
+            await self._move_message(m)
 
-        elif action == "flag":
+        elif m.action == "flag":
             await self.client.add_reaction(
-                channel_id=channel_id,
-                message_id=message_id,
+                channel_id=m.channel_id,
+                message_id=m.message_id,
                 emoji="⚠️",
             )
-            logger.info(f"Flagged message {message_id} for review")
-            await self._send_audit_log(action, inputs, output, dry_run=False)
+            logger.info(f"Flagged message {m.message_id} for review")
+            await self._send_audit_log(m, dry_run=False)
+
+        elif m.action == "delete":
+            self._pending_deletes.setdefault(m.channel_id, []).append(m)
+
+    async def _move_message(self, m: Moderation) -> None:
+        """Repost a message in the jobs channel and queue the original for deletion."""
+        # The original is only queued once the repost succeeded, so a failed
+        # repost never loses the user's post
+        await self.client.send_message(
+            channel_id=self.jobs_channel_id,
+            content=self._MOVED_TEMPLATE.format_map({
+                "channel_id": m.channel_id,
+                "author": m.author,
+                "message": m.message,
+            }),
+        )
+        self._pending_deletes.setdefault(m.channel_id, []).append(m)
 
-        elif action == "delete":
-            await self.client.delete_message(
-                channel_id=channel_id,
-                message_id=message_id,
+    async def flush_deletes(self) -> None:
+        """Delete queued messages with one bulk request per channel, then DM and audit each.
+
+        If a channel's delete fails, its messages get no DM or audit entry.
+        """
+        if not self._pending_deletes:
+            return
+        pending, self._pending_deletes = self._pending_deletes, {}
+        if not self.client:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.client.bulk_delete_messages(
+                    channel_id=channel_id,
+                    message_ids=[m.message_id for m in moderations],
+                )
+                for channel_id, moderations in pending.items()
+            ),
+            return_exceptions=True,
+        )
+        deleted: List[Moderation] = []
+        for (channel_id, moderations), result in zip(pending.items(), results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to delete {len(moderations)} messages from {channel_id}: {result}")
+            else:
+                deleted.extend(moderations)
+
+        results = await asyncio.gather(
+            *(self._after_delete(m) for m in deleted),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to notify author of removed message: {result}")
+
+    async def _after_delete(self, m: Moderation) -> None:
+        """DM the author of a moved or deleted message, then audit the action."""
+        if m.action == "move":
+            logger.info(f"Moved message {m.message_id} to jobs channel")
+            await self.client.send_dm(
+                user_id=m.author_id,
+                content=f"Your job posting was moved to <#{self.jobs_channel_id}>. "
+                        f"Please post job-related content there in the future.",
             )
+        else:
+            logger.info(f"Deleted message {m.message_id}")
             await self.client.send_dm(
-                user_id=meta["author_id"],
-                content=f"Your message was removed: {reason}\n\n"
+                user_id=m.author_id,
+                content=f"Your message was removed: {m.reason}\n\n"
                         f"If you believe this was a false positive, please let us know.",
             )
-            logger.info(f"Deleted message {message_id}")
-            await self._send_audit_log(action, inputs, output, dry_run=False)
+        await self._send_audit_log(m, dry_run=False)
 
-    async def _send_audit_log(
-        self, action: str, inputs: Dict[str, Any], output: PipelineOutput, dry_run: bool
-    ) -> None:
-        """Send audit log to moderator channel."""
+    async def _send_audit_log(self, m: Moderation, dry_run: bool) -> None:
+        """Send audit log to moderator channel.
+
+        Dry-run entries are queued and sent in bulk by flush_audit().
+        """
         if not self.audit_channel_id:
             return
 
-        meta = inputs.get("_meta", {})
-        message_id = meta.get("message_id", "unknown")
-        channel_id = meta.get("channel_id", "unknown")
-        author = inputs.get("author", "unknown")
-        intent = output.get("intent", "unknown")
-        reason = output.get("reason", "")
-        full_message = inputs.get("message", "")
-
-        dry_run_prefix = "🔍 **[DRY RUN]** " if dry_run else ""
-
-        action_emoji = {"move": "📦", "flag": "⚠️", "delete": "🗑️"}.get(action, "❓")
-
-        audit_message = (
-            f"{dry_run_prefix}{action_emoji} **Action: {action.upper()}**\n"
-            f"**Author:** {author}\n"
-            f"**Channel:** <#{channel_id}>\n"
-            f"**Intent:** {intent}\n"
-            f"**Reason:** {reason}\n"
-            f"**Message:** {full_message}\n"
-            f"**Message ID:** {message_id}"
-        )
+        audit_message = self._AUDIT_TEMPLATE.format_map({
+            "prefix": "🔍 **[DRY RUN]** " if dry_run else "",
+            "emoji": self._ACTION_EMOJI.get(m.action, "❓"),
+            "action": m.action.upper(),
+            "author": m.author,
+            "channel_id": m.channel_id or "unknown",
+            "intent": m.intent,
+            "reason": m.reason,
+            "message": m.message,
+            "message_id": m.message_id or "unknown",
+        })
+
+        if dry_run:
+            self._pending_audit.append(audit_message[:_DISCORD_MAX_LEN])
+            return
 
         try:
             await self.client.send_message(
@@ -213,31 +491,51 @@ class JobPostingGateway(CronGateway):
         except Exception as e:
             logger.warning(f"Failed to send audit log: {e}")
 
-    async def _log_dry_run_action(
-        self, action: str, inputs: Dict[str, Any], output: PipelineOutput
-    ) -> None:
-        """Log what would happen without executing."""
-        meta = inputs.get("_meta", {})
-        message_id = meta.get("message_id")
-        channel_id = meta.get("channel_id")
-        author = inputs.get("author", "unknown")
-        reason = output.get("reason", "")
+    async def flush_audit(self) -> None:
+        """Send queued dry-run audit entries, packed into as few messages as fit."""
+        if not self._pending_audit:
+            return
+        pending, self._pending_audit = self._pending_audit, []
+        if not self.audit_channel_id or not self.client:
+            return
 
-        if action == "move":
-            logger.info(
-                f"[DRY RUN] WOULD move message {message_id} from {author} "
-                f"to jobs channel {self.jobs_channel_id}"
-            )
-            logger.info(f"[DRY RUN] WOULD delete original from #{channel_id}")
-            logger.info(f"[DRY RUN] WOULD DM {meta.get('author_id')} about the move")
+        chunks: List[str] = []
+        current: List[str] = []
+        size = 0
+        for entry in pending:
+            # +2 for the blank line separating entries
+            if current and (len(current) == _AUDIT_BATCH_SIZE or size + 2 + len(entry) > _DISCORD_MAX_LEN):
+                chunks.append("\n\n".join(current))
+                current, size = [], 0
+            size += len(entry) + (2 if current else 0)
+            current.append(entry)
+        chunks.append("\n\n".join(current))
+
+        results = await asyncio.gather(
+            *(
+                self.client.send_message(channel_id=self.audit_channel_id, content=chunk)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send audit log: {result}")
 
-        elif action == "flag":
+    def _log_dry_run_action(self, m: Moderation) -> None:
+        """Log what would happen without executing."""
+        if m.action == "move":
             logger.info(
-                f"[DRY RUN] WOULD add ⚠️ reaction to message {message_id}"
+                "[DRY RUN] WOULD move message %s from %s to jobs channel %s, "
+                "delete the original from #%s and DM %s about the move",
+                m.message_id, m.author, self.jobs_channel_id, m.channel_id, m.author_id,
             )
 
-        elif action == "delete":
+        elif m.action == "flag":
+            logger.info("[DRY RUN] WOULD add ⚠️ reaction to message %s", m.message_id)
+
+        elif m.action == "delete":
             logger.info(
-                f"[DRY RUN] WOULD delete message {message_id}: {reason}"
+                "[DRY RUN] WOULD delete message %s and DM %s: %s",
+                m.message_id, m.author_id, m.reason,
             )
-            logger.info(f"[DRY RUN] WOULD DM {meta.get('author_id')}: {reason}")
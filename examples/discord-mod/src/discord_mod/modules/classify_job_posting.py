@@ -1,3 +1,8 @@
+import copy
+import functools
+import json
+import os
+from pathlib import Path
 from typing import Literal
 
 import dspy
@@ -5,6 +10,22 @@ import dspy
 from discord_mod.gateways.job_posting_gateway import JobPostingGateway
 from dspy_cli.gateway import IdentityGateway
 
+# Optimized program state, e.g. from `optimizer.compile(ClassifyJobPosting(), ...).save(path)`.
+# Loaded automatically when present; otherwise the zero-shot program is used.
+COMPILED_PROGRAM_PATH = Path(
+    os.environ.get("CLASSIFIER_PROGRAM_PATH")
+    or Path(__file__).resolve().parents[3] / "data" / "classify_job_posting.json"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_state() -> dict | None:
+    """Read the saved program once per process; instances are created per request."""
+    if not COMPILED_PROGRAM_PATH.exists():
+        return None
+    with open(COMPILED_PROGRAM_PATH) as f:
+        return json.load(f)
+
 
 class ClassifyJobPosting(dspy.Module):
     """Classify Discord messages as job postings, job-seeking, or general chat.
@@ -20,6 +41,10 @@ class ClassifyJobPosting(dspy.Module):
         super().__init__()
         self.classifier = dspy.ChainOfThought(JobPostingSignature)
 
+        state = _compiled_state()
+        if state is not None:
+            self.load_state(copy.deepcopy(state))
+
     def forward(
         self,
         message: str,
@@ -0,0 +1,61 @@
+"""File-based store for the newest fetched message ID per channel.
+
+Discord message IDs are snowflakes, so they increase monotonically. Keeping
+the newest ID per channel lets each poll ask only for messages after it
+instead of re-fetching recent history.
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelCursorStore:
+    """Track the newest fetched message ID per channel."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._cursors: Dict[str, str] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Load existing cursors from file."""
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path) as f:
+                self._cursors = json.load(f)
+            logger.info(f"Loaded cursors for {len(self._cursors)} channels from {self.path}")
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Failed to load channel cursors: {e}")
+            self._cursors = {}
+
+    def get(self, channel_id: str) -> Optional[str]:
+        """Return the newest fetched message ID for a channel, if any."""
+        return self._cursors.get(channel_id)
+
+    def advance(self, channel_id: str, message_id: str) -> None:
+        """Move the cursor forward to message_id if it is newer."""
+        current = self._cursors.get(channel_id)
+        if current is None or int(message_id) > int(current):
+            self._cursors[channel_id] = message_id
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write cursors to disk if they changed."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(self._cursors, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except IOError as e:
+            logger.error(f"Failed to save channel cursors: {e}")
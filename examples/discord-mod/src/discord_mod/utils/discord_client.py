@@ -4,18 +4,61 @@ This is a simple async client that wraps the Discord REST API.
 For production use, consider using discord.py or similar libraries.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+import urllib.parse
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
 DISCORD_API_BASE = "https://discord.com/api/v10"
+CHANNEL_CACHE_TTL = 300.0  # seconds a resolved channel name is reused
+
+# Bulk delete accepts 2-100 IDs, all younger than two weeks
+BULK_DELETE_MAX = 100
+BULK_DELETE_MAX_AGE = 14 * 24 * 60 * 60 - 60  # seconds, with a minute of slack
+DISCORD_EPOCH_MS = 1420070400000
+
+
+# Retries for a rate-limited (429) request before giving up
+RATE_LIMIT_RETRIES = 3
+
+# Message IDs and reaction emoji share their route's rate-limit bucket
+_ROUTE_ID_RE = re.compile(r"/messages/\d+|/reactions/.*")
+# Buckets are tracked separately for each channel, guild or webhook ID
+_MAJOR_PARAM_RE = re.compile(r"^/(?:channels|guilds|webhooks)/(\d+)")
+
+
+def _route_key(method: str, endpoint: str) -> str:
+    """Identify a rate-limit route: method plus path with its major parameter kept."""
+    path = endpoint.split("?", 1)[0]
+    return f"{method} " + _ROUTE_ID_RE.sub(
+        lambda m: "/messages/:id" if m.group().startswith("/messages") else "/reactions/:emoji",
+        path,
+    )
+
+
+def _major_param(endpoint: str) -> str:
+    """Return the endpoint's major parameter (channel, guild or webhook ID), or ""."""
+    match = _MAJOR_PARAM_RE.match(endpoint)
+    return match.group(1) if match else ""
+
+
+def _snowflake_time(snowflake: str) -> float:
+    """Return the Unix timestamp (seconds) encoded in a Discord snowflake ID."""
+    return ((int(snowflake) >> 22) + DISCORD_EPOCH_MS) / 1000
 
 
 class DiscordClient:
-    """Async Discord API client for moderation actions."""
+    """Async Discord API client for moderation actions.
+
+    Holds one pooled HTTP/2 connection to Discord for its whole lifetime;
+    call aclose() when done with it, or use it as an async context manager.
+    """
 
     def __init__(self, token: str):
         self.token = token
@@ -23,6 +66,31 @@ class DiscordClient:
             "Authorization": f"Bot {token}",
             "Content-Type": "application/json",
         }
+        self._http = httpx.AsyncClient(
+            base_url=DISCORD_API_BASE,
+            http2=True,
+            headers=self.headers,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        # channel_id -> (fetched_at, name)
+        self._channel_cache: Dict[str, tuple[float, str]] = {}
+        # Rate limits, learned from X-RateLimit-* response headers
+        self._route_buckets: Dict[str, str] = {}  # route key -> bucket hash
+        # (bucket, major parameter) -> (remaining, reset_at, limit); routes share
+        # a bucket hash across channels, but each channel has its own limit
+        self._buckets: Dict[Tuple[str, str], tuple[int, float, int]] = {}
+        self._bucket_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._global_reset_at = 0.0
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "DiscordClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
 
     async def _request(
         self,
@@ -30,19 +98,76 @@ class DiscordClient:
         endpoint: str,
         json: Optional[Dict] = None,
     ) -> Any:
-        """Make an authenticated request to the Discord API."""
-        url = f"{DISCORD_API_BASE}{endpoint}"
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        """Make an authenticated request to the Discord API.
+
+        Waits instead of sending when the route's rate-limit bucket is
+        exhausted, and retries 429 responses after Discord's retry_after.
+        """
+        route = _route_key(method, endpoint)
+        major = _major_param(endpoint)
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            await self._wait_for_rate_limit(route, major)
+            response = await self._http.request(
                 method=method,
-                url=url,
-                headers=self.headers,
+                url=endpoint,
                 json=json,
             )
-            if response.status_code == 204:
-                return None
-            response.raise_for_status()
-            return response.json()
+            self._update_rate_limit(route, major, response)
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+
+            try:
+                body = response.json()
+            except ValueError:
+                body = {}
+            retry_after = float(body.get("retry_after") or response.headers.get("Retry-After") or 1.0)
+            if body.get("global"):
+                self._global_reset_at = time.monotonic() + retry_after
+            logger.warning(f"Rate limited on {route}; retrying in {retry_after:.2f}s")
+            await asyncio.sleep(retry_after)
+
+        if response.status_code == 204:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    async def _wait_for_rate_limit(self, route: str, major: str) -> None:
+        """Sleep until a request on route is allowed, reserving one slot in its bucket."""
+        delay = self._global_reset_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        bucket = self._route_buckets.get(route)
+        if bucket is None or (bucket, major) not in self._buckets:
+            # Not seen yet; the first response tells us its bucket
+            return
+
+        key = (bucket, major)
+        lock = self._bucket_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            remaining, reset_at, limit = self._buckets[key]
+            if remaining <= 0:
+                delay = reset_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                # A fresh window; responses will correct the count
+                remaining = limit
+            self._buckets[key] = (remaining - 1, reset_at, limit)
+
+    def _update_rate_limit(self, route: str, major: str, response: httpx.Response) -> None:
+        """Record the bucket state reported in a response's headers."""
+        headers = response.headers
+        bucket = headers.get("X-RateLimit-Bucket")
+        if bucket is None:
+            return
+        try:
+            remaining = int(headers["X-RateLimit-Remaining"])
+            reset_after = float(headers["X-RateLimit-Reset-After"])
+            limit = int(headers["X-RateLimit-Limit"])
+        except (KeyError, ValueError):
+            return
+        self._route_buckets[route] = bucket
+        self._buckets[bucket, major] = (remaining, time.monotonic() + reset_after, limit)
 
     async def get_recent_messages(
         self,
@@ -65,15 +190,53 @@ class DiscordClient:
             endpoint += f"&after={after}"
 
         try:
-            messages = await self._request("GET", endpoint)
-            channel = await self.get_channel(channel_id)
+            # The name lookup is usually a cache hit; on a miss it overlaps
+            # with the messages request instead of following it
+            messages, name = await asyncio.gather(
+                self._request("GET", endpoint),
+                self.get_channel_name(channel_id),
+            )
             for msg in messages:
-                msg["channel_name"] = channel.get("name", "unknown")
+                msg["channel_name"] = name
             return messages
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to fetch messages from {channel_id}: {e}")
             return []
 
+    async def get_recent_messages_multi(
+        self,
+        channel_ids: Iterable[str],
+        limit: int = 50,
+        after: Optional[Mapping[str, Optional[str]]] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Fetch recent messages from several channels concurrently.
+
+        Args:
+            channel_ids: The channels to fetch from
+            limit: Max messages to return per channel (1-100)
+            after: Per-channel message ID to fetch after, if any
+
+        Returns:
+            Messages keyed by channel ID; a channel that fails yields []
+        """
+        channel_ids = list(channel_ids)
+        after = after or {}
+        results = await asyncio.gather(
+            *(
+                self.get_recent_messages(channel_id, limit=limit, after=after.get(channel_id))
+                for channel_id in channel_ids
+            ),
+            return_exceptions=True,
+        )
+
+        messages_by_channel = {}
+        for channel_id, result in zip(channel_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to fetch messages from {channel_id}: {result}")
+                result = []
+            messages_by_channel[channel_id] = result
+        return messages_by_channel
+
     async def get_channel(self, channel_id: str) -> Dict[str, Any]:
         """Get channel information."""
         try:
@@ -81,6 +244,23 @@ class DiscordClient:
         except httpx.HTTPStatusError:
             return {}
 
+    async def get_channel_name(self, channel_id: str) -> str:
+        """Get a channel's name, cached for CHANNEL_CACHE_TTL seconds."""
+        cached = self._channel_cache.get(channel_id)
+        if cached is not None and time.monotonic() - cached[0] < CHANNEL_CACHE_TTL:
+            return cached[1]
+
+        name = (await self.get_channel(channel_id)).get("name")
+        if name is None:
+            # Lookup failed; don't cache so the next poll retries it
+            return "unknown"
+        self._channel_cache[channel_id] = (time.monotonic(), name)
+        return name
+
+    def invalidate_channel(self, channel_id: str) -> None:
+        """Drop a cached channel name, e.g. after the channel is renamed."""
+        self._channel_cache.pop(channel_id, None)
+
     async def send_message(
         self,
         channel_id: str,
@@ -104,6 +284,41 @@ class DiscordClient:
             f"/channels/{channel_id}/messages/{message_id}",
         )
 
+    async def bulk_delete_messages(
+        self,
+        channel_id: str,
+        message_ids: List[str],
+    ) -> None:
+        """Delete many messages from one channel with as few requests as possible.
+
+        Duplicate IDs are dropped first, since Discord rejects a bulk-delete
+        payload containing them. Recent messages then go through the
+        bulk-delete endpoint in groups of up to BULK_DELETE_MAX. The endpoint
+        needs at least two IDs, so a single ID (including a lone leftover
+        group) and messages older than two weeks are deleted one at a time
+        with delete_message().
+        """
+        # Dedupe, keeping the caller's order
+        message_ids = list(dict.fromkeys(message_ids))
+        cutoff = time.time() - BULK_DELETE_MAX_AGE
+        recent = [mid for mid in message_ids if _snowflake_time(mid) > cutoff]
+        single = [mid for mid in message_ids if _snowflake_time(mid) <= cutoff]
+
+        requests = []
+        for start in range(0, len(recent), BULK_DELETE_MAX):
+            chunk = recent[start:start + BULK_DELETE_MAX]
+            if len(chunk) == 1:
+                single.extend(chunk)
+                continue
+            requests.append(self._request(
+                "POST",
+                f"/channels/{channel_id}/messages/bulk-delete",
+                json={"messages": chunk},
+            ))
+        requests.extend(self.delete_message(channel_id, mid) for mid in single)
+
+        await asyncio.gather(*requests)
+
     async def add_reaction(
         self,
         channel_id: str,
@@ -111,7 +326,6 @@ class DiscordClient:
         emoji: str,
     ) -> None:
         """Add a reaction to a message."""
-        import urllib.parse
         encoded_emoji = urllib.parse.quote(emoji)
         await self._request(
             "PUT",
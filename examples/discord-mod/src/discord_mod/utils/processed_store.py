@@ -2,14 +2,29 @@
 
 Prevents reprocessing the same messages across restarts.
 Uses a JSON file that can be persisted on a Fly.io volume.
+
+Each newly processed ID is appended to a small JSONL log next to the JSON
+snapshot, so marking a message writes one line instead of rewriting the
+whole file. The log is folded back into the snapshot on flush() and after
+TTL cleanup.
 """
 
 import json
 import logging
 import os
 import time
+from collections import deque
 from pathlib import Path
-from typing import Set
+from typing import BinaryIO, Iterable, Set
+
+try:
+    # orjson is optional; fall back to the stdlib encoder when it isn't installed
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +44,10 @@ class ProcessedMessageStore:
     
     Uses debounced saving to avoid excessive disk writes when processing
     many messages in sequence.
+
+    IDs are kept in a set for lookups and in a deque in the order they were
+    marked, so TTL cleanup pops expired IDs off the front instead of
+    scanning everything. An ID keeps the timestamp it was first marked with.
     """
 
     def __init__(
@@ -42,27 +61,74 @@ class ProcessedMessageStore:
         self.ttl_seconds = ttl_days * 24 * 60 * 60
         self.save_interval = save_interval
         self.cleanup_interval = cleanup_interval
-        self._data: dict[str, float] = {}  # message_id -> timestamp
-        self._dirty = False
+        self._ids: set[str] = set()
+        self._order: deque[tuple[str, float]] = deque()  # (message_id, timestamp), oldest first
+        self._log_path = self.path.with_suffix(".log")
+        self._log_fp: BinaryIO | None = None
+        self._dirty = False  # snapshot is behind the in-memory entries
         self._last_save: float = 0
         self._last_cleanup: float = time.time()
         self._load()
 
     def _load(self) -> None:
-        """Load existing data from file."""
+        """Load the snapshot, then replay IDs appended to the log since."""
         if self.path.exists():
             try:
-                with open(self.path) as f:
-                    self._data = json.load(f)
-                logger.info(f"Loaded {len(self._data)} processed message IDs from {self.path}")
-            except (json.JSONDecodeError, IOError) as e:
+                data = _json_loads(self.path.read_bytes())
+                if isinstance(data, dict):
+                    # Legacy snapshot: {message_id: timestamp}
+                    data = sorted(data.items(), key=lambda item: item[1])
+                    self._dirty = True
+                self._add_entries(data)
+                logger.info(f"Loaded {len(self._ids)} processed message IDs from {self.path}")
+            except (ValueError, IOError) as e:
                 logger.warning(f"Failed to load processed messages: {e}")
-                self._data = {}
+                self._ids.clear()
+                self._order.clear()
         else:
             logger.info(f"No existing processed messages file at {self.path}")
 
+        if self._log_path.exists():
+            replayed = 0
+            try:
+                with open(self._log_path, "rb") as f:
+                    for line in f:
+                        try:
+                            entry = _json_loads(line)
+                        except ValueError:
+                            # Torn final line from a crash mid-write
+                            continue
+                        replayed += self._add(entry["i"], entry["t"])
+            except IOError as e:
+                logger.warning(f"Failed to replay processed messages log: {e}")
+            if replayed:
+                self._dirty = True
+                logger.info(f"Replayed {replayed} processed message IDs from {self._log_path}")
+
+    def _add(self, message_id: str, timestamp: float) -> bool:
+        """Record an ID unless already present; returns True if it was new."""
+        if message_id in self._ids:
+            return False
+        self._ids.add(message_id)
+        self._order.append((message_id, timestamp))
+        return True
+
+    def _add_entries(self, entries: Iterable[tuple[str, float]]) -> None:
+        for message_id, timestamp in entries:
+            self._add(message_id, timestamp)
+
+    def _append_log(self, message_id: str, timestamp: float) -> None:
+        """Durably record one processed ID without rewriting the snapshot."""
+        try:
+            if self._log_fp is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._log_fp = open(self._log_path, "ab", buffering=0)
+            self._log_fp.write(_json_dumps({"i": message_id, "t": timestamp}) + b"\n")
+        except IOError as e:
+            logger.error(f"Failed to append to processed messages log: {e}")
+
     def _save(self, force: bool = False) -> None:
-        """Save data to file if dirty and interval elapsed (or forced)."""
+        """Rewrite the snapshot and truncate the log if dirty and interval elapsed (or forced)."""
         if not self._dirty:
             return
         
@@ -73,46 +139,60 @@ class ProcessedMessageStore:
         try:
             self.path.parent.mkdir(parents=True, exist_ok=True)
             tmp_path = self.path.with_suffix(".tmp")
-            with open(tmp_path, "w") as f:
-                json.dump(self._data, f)
+            # Oldest first, as [[message_id, timestamp], ...]
+            tmp_path.write_bytes(_json_dumps(list(self._order)))
             os.replace(tmp_path, self.path)
+            # Everything in the log is now in the snapshot
+            if self._log_fp is not None:
+                self._log_fp.close()
+                self._log_fp = None
+            self._log_path.unlink(missing_ok=True)
             self._dirty = False
             self._last_save = now
         except IOError as e:
             logger.error(f"Failed to save processed messages: {e}")
 
-    def _cleanup_old(self, force: bool = False) -> None:
-        """Remove entries older than TTL (debounced unless forced)."""
+    def _cleanup_old(self, force: bool = False) -> bool:
+        """Remove entries older than TTL (debounced unless forced).
+
+        Returns True if cleanup ran.
+        """
         now = time.time()
         if not force and (now - self._last_cleanup) < self.cleanup_interval:
-            return
+            return False
         
         cutoff = now - self.ttl_seconds
-        old_count = len(self._data)
-        self._data = {k: v for k, v in self._data.items() if v > cutoff}
-        removed = old_count - len(self._data)
+        order, ids = self._order, self._ids
+        removed = 0
+        while order and order[0][1] <= cutoff:
+            ids.discard(order.popleft()[0])
+            removed += 1
         self._last_cleanup = now
         if removed > 0:
             self._dirty = True
             logger.info(f"Cleaned up {removed} old processed message IDs")
+        return True
 
     def is_processed(self, message_id: str) -> bool:
         """Check if a message has already been processed."""
-        return message_id in self._data
+        return message_id in self._ids
 
     def mark_processed(self, message_id: str) -> None:
-        """Mark a message as processed (debounced save and cleanup)."""
-        self._data[message_id] = time.time()
-        self._dirty = True
-        self._cleanup_old()
-        self._save()
+        """Mark a message as processed (appended to the log; debounced cleanup)."""
+        now = time.time()
+        if self._add(message_id, now):
+            self._dirty = True
+            self._append_log(message_id, now)
+        if self._cleanup_old():
+            # Periodically fold the log back into the snapshot
+            self._save()
 
     def mark_batch_processed(self, message_ids: Set[str]) -> None:
         """Mark multiple messages as processed (immediate save)."""
         now = time.time()
         for mid in message_ids:
-            self._data[mid] = now
-        self._dirty = True
+            if self._add(mid, now):
+                self._dirty = True
         self._cleanup_old(force=True)
         self._save(force=True)
 
@@ -123,4 +203,4 @@ class ProcessedMessageStore:
 
     def get_unprocessed(self, message_ids: Set[str]) -> Set[str]:
         """Filter to only unprocessed message IDs."""
-        return message_ids - set(self._data.keys())
+        return message_ids - self._ids
@@ -0,0 +1,216 @@
+"""Tests for DiscordClient's rate limiting, against an httpx.MockTransport."""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from discord_mod.utils import discord_client
+from discord_mod.utils.discord_client import DISCORD_API_BASE, DISCORD_EPOCH_MS, DiscordClient
+
+_real_sleep = asyncio.sleep
+
+
+class FakeClock:
+    """Stands in for time.monotonic() and asyncio.sleep(); sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(round(delay, 3))
+        wake_at = self.now + delay
+        # Let other tasks run first, as a real sleep would
+        await _real_sleep(0)
+        self.now = max(self.now, wake_at)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(discord_client, "time", SimpleNamespace(monotonic=clock.monotonic, time=time.time))
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def make_client(handler):
+    client = DiscordClient(token="test-token")
+    client._http = httpx.AsyncClient(base_url=DISCORD_API_BASE, transport=httpx.MockTransport(handler))
+    return client
+
+
+def snowflake(age_seconds, sequence=0):
+    """Build a message ID for a message posted age_seconds ago."""
+    timestamp_ms = int((time.time() - age_seconds) * 1000)
+    return str(((timestamp_ms - DISCORD_EPOCH_MS) << 22) | sequence)
+
+
+def bulk_delete_recorder():
+    """Return a transport handler and the (method, path, payload) list it records."""
+    requests = []
+
+    def handler(request):
+        payload = json.loads(request.content) if request.content else None
+        requests.append((request.method, request.url.path, payload))
+        return httpx.Response(204)
+
+    return handler, requests
+
+
+def rate_limit_headers(bucket, remaining, reset_after, limit=5):
+    return {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+        "X-RateLimit-Limit": str(limit),
+    }
+
+
+def test_waits_for_exhausted_bucket(clock):
+    def handler(request):
+        return httpx.Response(200, json={"id": "1"}, headers=rate_limit_headers("abc", 0, 30))
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.send_message("1", "first")
+            assert clock.sleeps == []
+            await client.send_message("1", "second")
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [30]
+
+
+def test_retries_429_after_retry_after(clock):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(
+                429,
+                json={"message": "You are being rate limited.", "retry_after": 0.5, "global": False},
+                headers=rate_limit_headers("abc", 0, 0.5),
+            )
+        return httpx.Response(200, json={"id": "1"}, headers=rate_limit_headers("abc", 4, 5))
+
+    async def scenario():
+        async with make_client(handler) as client:
+            return await client.send_message("1", "hello")
+
+    assert asyncio.run(scenario()) == {"id": "1"}
+    assert len(calls) == 2
+    assert clock.sleeps == [0.5]
+
+
+def test_global_limit_holds_other_routes(clock):
+    first_429_sent = asyncio.Event()
+    seen_at = {}
+
+    def handler(request):
+        channel_id = request.url.path.split("/")[-2]
+        if channel_id == "1" and not first_429_sent.is_set():
+            first_429_sent.set()
+            return httpx.Response(429, json={"retry_after": 2, "global": True})
+        seen_at.setdefault(channel_id, clock.now)
+        return httpx.Response(200, json={"id": channel_id})
+
+    async def scenario():
+        async with make_client(handler) as client:
+            first = asyncio.create_task(client.send_message("1", "a"))
+            await first_429_sent.wait()
+            await client.send_message("2", "b")
+            await first
+
+    asyncio.run(scenario())
+    # Channel 2 never hit a 429 itself, yet waited out the global limit too
+    assert seen_at == {"1": 1002.0, "2": 1002.0}
+
+
+def test_channels_sharing_bucket_hash_are_limited_separately(clock):
+    def handler(request):
+        channel_id = request.url.path.split("/")[-2]
+        remaining = 0 if channel_id == "1" else 4
+        return httpx.Response(200, json={"id": "1"}, headers=rate_limit_headers("shared", remaining, 30))
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.send_message("1", "a")
+            await client.send_message("2", "b")
+            # Channel 2's bucket has room even though channel 1's is empty
+            await client.send_message("2", "c")
+            assert clock.sleeps == []
+            await client.send_message("1", "d")
+
+    asyncio.run(scenario())
+    assert clock.sleeps == [30]
+
+
+BULK_PATH = "/api/v10/channels/1/messages/bulk-delete"
+
+
+def test_bulk_delete_splits_into_groups_of_100():
+    handler, requests = bulk_delete_recorder()
+    ids = [snowflake(60, sequence) for sequence in range(101)]
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.bulk_delete_messages("1", ids)
+
+    asyncio.run(scenario())
+    # The lone leftover ID can't go through bulk delete, which needs two
+    assert sorted(requests, key=lambda r: r[0]) == [
+        ("DELETE", f"/api/v10/channels/1/messages/{ids[100]}", None),
+        ("POST", BULK_PATH, {"messages": ids[:100]}),
+    ]
+
+
+def test_bulk_delete_single_id_uses_delete():
+    handler, requests = bulk_delete_recorder()
+    message_id = snowflake(60)
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.bulk_delete_messages("1", [message_id])
+
+    asyncio.run(scenario())
+    assert requests == [("DELETE", f"/api/v10/channels/1/messages/{message_id}", None)]
+
+
+def test_bulk_delete_drops_duplicates():
+    handler, requests = bulk_delete_recorder()
+    first, second = snowflake(60, 0), snowflake(60, 1)
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.bulk_delete_messages("1", [first, second, first, second])
+
+    asyncio.run(scenario())
+    assert requests == [("POST", BULK_PATH, {"messages": [first, second]})]
+
+
+def test_bulk_delete_old_messages_one_at_a_time():
+    handler, requests = bulk_delete_recorder()
+    recent = [snowflake(60, 0), snowflake(60, 1)]
+    old = [snowflake(15 * 24 * 60 * 60, 0), snowflake(15 * 24 * 60 * 60, 1)]
+
+    async def scenario():
+        async with make_client(handler) as client:
+            await client.bulk_delete_messages("1", [old[0], recent[0], old[1], recent[1]])
+
+    asyncio.run(scenario())
+    assert sorted(requests, key=lambda r: (r[0], r[1])) == [
+        ("DELETE", f"/api/v10/channels/1/messages/{old[0]}", None),
+        ("DELETE", f"/api/v10/channels/1/messages/{old[1]}", None),
+        ("POST", BULK_PATH, {"messages": recent}),
+    ]
@@ -14,10 +14,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 import dspy
-from dspy.evaluate import Evaluate
 
 from discord_mod.modules.classify_job_posting import ClassifyJobPosting
-from data.eval_dataset import get_eval_dataset, get_dataset_stats, get_dataset_by_category
+from data.eval_dataset import get_eval_dataset, get_dataset_stats
 
 
 def intent_metric(example, pred, _trace=None) -> float:
@@ -40,6 +39,33 @@ def combined_metric(example, pred, _trace=None) -> float:
     return 1.0 if (intent_correct and action_correct) else 0.0
 
 
+def _predict_all(classifier, devset, num_threads: int) -> list:
+    """Classify every example in one threaded batch; failed examples yield None.
+
+    Examples with the same (message, author, channel_name) render the same
+    prompt, so each distinct one is classified once and its prediction shared.
+    """
+    unique: dict[tuple[str, str, str], int] = {}
+    for ex in devset:
+        unique.setdefault((ex.message, ex.author, ex.channel_name), len(unique))
+
+    examples = [
+        dspy.Example(message=message, author=author, channel_name=channel_name)
+        .with_inputs("message", "author", "channel_name")
+        for message, author, channel_name in unique
+    ]
+    unique_preds = classifier.batch(examples, num_threads=num_threads)
+    return [unique_preds[unique[(ex.message, ex.author, ex.channel_name)]] for ex in devset]
+
+
+def _score(metric, devset, preds) -> float:
+    """Percentage of examples where metric passes; a failed prediction scores 0."""
+    if not devset:
+        return 0.0
+    total = sum(metric(ex, pred) for ex, pred in zip(devset, preds) if pred is not None)
+    return 100.0 * total / len(devset)
+
+
 def run_evaluation(model: str = "openai/gpt-5-nano", num_threads: int = 4):
     """Run the full evaluation suite."""
     # Configure DSPy
@@ -63,39 +89,19 @@ def run_evaluation(model: str = "openai/gpt-5-nano", num_threads: int = 4):
     # Initialize the module
     classifier = ClassifyJobPosting()
 
-    # Run evaluations with different metrics
-    print("\n[1/3] Evaluating Intent Accuracy...")
-    intent_evaluator = Evaluate(
-        devset=devset,
-        metric=intent_metric,
-        num_threads=num_threads,
-        display_progress=True,
-        display_table=5,
-    )
-    intent_result = intent_evaluator(classifier)
-    print(f"Intent Accuracy: {intent_result.score:.1f}%")
-
-    print("\n[2/3] Evaluating Action Accuracy...")
-    action_evaluator = Evaluate(
-        devset=devset,
-        metric=action_metric,
-        num_threads=num_threads,
-        display_progress=True,
-        display_table=5,
-    )
-    action_result = action_evaluator(classifier)
-    print(f"Action Accuracy: {action_result.score:.1f}%")
-
-    print("\n[3/3] Evaluating Combined (Intent + Action)...")
-    combined_evaluator = Evaluate(
-        devset=devset,
-        metric=combined_metric,
-        num_threads=num_threads,
-        display_progress=True,
-        display_table=5,
-    )
-    combined_result = combined_evaluator(classifier)
-    print(f"Combined Accuracy: {combined_result.score:.1f}%")
+    # Classify once; every metric below is scored from the same predictions
+    print("\nClassifying examples...")
+    preds = _predict_all(classifier, devset, num_threads)
+    failed = sum(pred is None for pred in preds)
+    if failed:
+        print(f"  {failed} examples failed and score 0")
+
+    intent_score = _score(intent_metric, devset, preds)
+    action_score = _score(action_metric, devset, preds)
+    combined_score = _score(combined_metric, devset, preds)
+    print(f"Intent Accuracy: {intent_score:.1f}%")
+    print(f"Action Accuracy: {action_score:.1f}%")
+    print(f"Combined Accuracy: {combined_score:.1f}%")
 
     # Per-category breakdown
     print("\n" + "=" * 60)
@@ -104,36 +110,31 @@ def run_evaluation(model: str = "openai/gpt-5-nano", num_threads: int = 4):
 
     categories = ["nuanced", "sanity_general", "sanity_job", "spam", "jobs_channel"]
     for category in categories:
-        cat_devset = get_dataset_by_category(category)
-        if not cat_devset:
+        cat_pairs = [(ex, pred) for ex, pred in zip(devset, preds) if ex.category == category]
+        if not cat_pairs:
             continue
 
-        cat_evaluator = Evaluate(
-            devset=cat_devset,
-            metric=action_metric,
-            num_threads=num_threads,
-            display_progress=False,
-        )
-        cat_result = cat_evaluator(classifier)
-        print(f"  {category}: {cat_result.score:.1f}% ({len(cat_devset)} examples)")
+        cat_devset, cat_preds = zip(*cat_pairs)
+        cat_score = _score(action_metric, cat_devset, cat_preds)
+        print(f"  {category}: {cat_score:.1f}% ({len(cat_devset)} examples)")
 
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
-    print(f"  Intent Accuracy:     {intent_result.score:.1f}%")
-    print(f"  Action Accuracy:     {action_result.score:.1f}%")
-    print(f"  Combined Accuracy:   {combined_result.score:.1f}%")
+    print(f"  Intent Accuracy:     {intent_score:.1f}%")
+    print(f"  Action Accuracy:     {action_score:.1f}%")
+    print(f"  Combined Accuracy:   {combined_score:.1f}%")
     print("=" * 60)
 
     return {
-        "intent_accuracy": intent_result.score,
-        "action_accuracy": action_result.score,
-        "combined_accuracy": combined_result.score,
+        "intent_accuracy": intent_score,
+        "action_accuracy": action_score,
+        "combined_accuracy": combined_score,
     }
 
 
-def analyze_errors(model: str = "openai/gpt-5-nano"):
+def analyze_errors(model: str = "openai/gpt-5-nano", num_threads: int = 4):
     """Analyze specific error cases for debugging."""
     lm = dspy.LM(model)
     dspy.configure(lm=lm)
@@ -143,13 +144,13 @@ def analyze_errors(model: str = "openai/gpt-5-nano"):
 
     print("Analyzing predictions...\n")
 
+    preds = _predict_all(classifier, devset, num_threads)
+
     errors = []
-    for example in devset:
-        pred = classifier(
-            message=example.message,
-            author=example.author,
-            channel_name=example.channel_name,
-        )
+    for example, pred in zip(devset, preds):
+        if pred is None:
+            print(f"Classification failed: {example.message[:100]}...")
+            continue
 
         if pred.intent != example.intent or pred.action != example.action:
             errors.append({
@@ -183,6 +184,6 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     if args.analyze:
-        analyze_errors(model=args.model)
+        analyze_errors(model=args.model, num_threads=args.threads)
     else:
         run_evaluation(model=args.model, num_threads=args.threads)
@@ -0,0 +1,163 @@
+"""Tests for JobPostingGateway's tick bookkeeping, using an in-memory Discord client."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from discord_mod.gateways.job_posting_gateway import _MAX_CLASSIFY_ATTEMPTS, JobPostingGateway
+from discord_mod.utils.cursor_store import ChannelCursorStore
+from discord_mod.utils.processed_store import ProcessedMessageStore
+
+CHANNEL = "1"
+
+
+class FakeDiscordClient:
+    """Serves messages newer than the requested cursor and records sent messages."""
+
+    def __init__(self, message_ids):
+        self.messages = [self._message(message_id) for message_id in message_ids]
+        self.sent = []
+        self.bulk_deleted = []
+        self.dms = []
+
+    @staticmethod
+    def _message(message_id):
+        return {
+            "id": message_id,
+            "content": f"Hiring for role {message_id}",
+            "author": {"id": "42", "username": "someone"},
+        }
+
+    def post(self, message_id):
+        self.messages.append(self._message(message_id))
+
+    async def get_recent_messages_multi(self, channel_ids, limit=50, after=None):
+        cursor = (after or {}).get(CHANNEL)
+        newer = [m for m in self.messages if cursor is None or int(m["id"]) > int(cursor)]
+        return {CHANNEL: newer[:limit]}
+
+    async def send_message(self, channel_id, content):
+        self.sent.append((channel_id, content))
+
+    async def bulk_delete_messages(self, channel_id, message_ids):
+        self.bulk_deleted.append((channel_id, list(message_ids)))
+
+    async def send_dm(self, user_id, content):
+        self.dms.append((user_id, content))
+
+    async def aclose(self):
+        pass
+
+
+def make_gateway(tmp_path, message_ids):
+    gateway = JobPostingGateway()
+    gateway.client = FakeDiscordClient(message_ids)
+    gateway.channel_ids = (CHANNEL,)
+    gateway.audit_channel_id = "audit"
+    gateway.processed_store = ProcessedMessageStore(path=str(tmp_path / "processed.json"))
+    gateway.cursors = ChannelCursorStore(tmp_path / "cursors.json")
+    return gateway
+
+
+async def run_tick(gateway, failing=(), output=None):
+    """Drive one tick the way the scheduler does; return the message IDs fetched."""
+    inputs = await gateway.get_pipeline_inputs()
+    for item in inputs:
+        if item["_meta"]["message_id"] in failing:
+            await gateway.on_error(item, RuntimeError("classification failed"))
+        else:
+            await gateway.on_complete(item, output or {"action": "allow"})
+    return [item["_meta"]["message_id"] for item in inputs]
+
+
+def test_always_failing_message_does_not_block_channel(tmp_path):
+    async def scenario():
+        gateway = make_gateway(tmp_path, ["100", "101", "102"])
+
+        assert await run_tick(gateway, failing={"100"}) == ["100", "101", "102"]
+        # Later messages are settled, but the cursor waits for the failed one
+        assert gateway.cursors.get(CHANNEL) is None
+
+        for _ in range(_MAX_CLASSIFY_ATTEMPTS - 1):
+            assert await run_tick(gateway, failing={"100"}) == ["100"]
+        # Given up on: skipped and the cursor moves past everything settled
+        assert gateway.processed_store.is_processed("100")
+        assert gateway.cursors.get(CHANNEL) == "102"
+
+        gateway.client.post("103")
+        assert await run_tick(gateway, failing={"100"}) == ["103"]
+        assert gateway.cursors.get(CHANNEL) == "103"
+
+    asyncio.run(scenario())
+
+
+def test_success_resets_failure_count(tmp_path):
+    async def scenario():
+        gateway = make_gateway(tmp_path, ["100"])
+
+        for _ in range(_MAX_CLASSIFY_ATTEMPTS - 1):
+            await run_tick(gateway, failing={"100"})
+        assert await run_tick(gateway) == ["100"]
+        assert gateway._failures == {}
+        assert gateway.cursors.get(CHANNEL) == "100"
+
+    asyncio.run(scenario())
+
+
+def test_failed_on_complete_is_counted_once(tmp_path):
+    async def scenario():
+        gateway = make_gateway(tmp_path, ["100", "101", "102"])
+        gateway.dry_run = True
+        log_action = gateway._log_dry_run_action
+
+        def log_or_fail(m):
+            if m.message_id == "100":
+                raise RuntimeError("logging failed")
+            log_action(m)
+
+        gateway._log_dry_run_action = log_or_fail
+        flag = {"action": "flag", "intent": "job_posting", "reason": "test"}
+
+        first, *rest = await gateway.get_pipeline_inputs()
+        # The scheduler reports a failed on_complete to on_error as well
+        try:
+            await gateway.on_complete(first, flag)
+        except RuntimeError as e:
+            await gateway.on_error(first, e)
+        assert gateway._tick_pending == 2
+
+        await gateway.on_complete(rest[0], flag)
+        # 102 is still outstanding, so its audit entry isn't flushed early
+        assert gateway.client.sent == []
+
+        await gateway.on_complete(rest[1], flag)
+        assert len(gateway.client.sent) == 1
+        audit = gateway.client.sent[0][1]
+        assert "101" in audit and "102" in audit
+
+    asyncio.run(scenario())
+
+
+def test_deletes_are_batched_per_tick(tmp_path):
+    async def scenario():
+        gateway = make_gateway(tmp_path, ["100", "101", "102"])
+        gateway.jobs_channel_id = "jobs"
+        client = gateway.client
+        actions = {"100": "delete", "101": "move", "102": "delete"}
+
+        inputs = await gateway.get_pipeline_inputs()
+        for item in inputs[:-1]:
+            action = actions[item["_meta"]["message_id"]]
+            await gateway.on_complete(item, {"action": action, "intent": "job_posting", "reason": "test"})
+        # Only the repost has gone out; deletes wait for the end of the tick
+        assert client.bulk_deleted == []
+        assert [channel for channel, _ in client.sent] == ["jobs"]
+
+        await gateway.on_complete(inputs[-1], {"action": "delete", "intent": "spam", "reason": "test"})
+        assert client.bulk_deleted == [(CHANNEL, ["100", "101", "102"])]
+        assert len(client.dms) == 3
+        assert [channel for channel, _ in client.sent] == ["jobs", "audit", "audit", "audit"]
+
+    asyncio.run(scenario())
@@ -1,5 +1,7 @@
 """Configuration loader for DSPy projects."""
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -7,12 +9,25 @@ from typing import Any, Dict, Optional
 import yaml
 from dotenv import load_dotenv
 
+try:
+    # LibYAML bindings are much faster than the pure-Python loader
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 
 class ConfigError(Exception):
     """Exception raised for configuration errors."""
     pass
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_yaml_file(path: Path, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, cached on (path, mtime, size) so unchanged files are parsed once."""
+    with open(path, "r") as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load DSPy configuration from YAML file and environment variables.
 
@@ -43,8 +58,9 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
 
     # Load YAML config
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        stat = config_path.stat()
+        # Copy so callers (and env resolution below) never mutate the cached parse
+        config = copy.deepcopy(_parse_yaml_file(config_path.resolve(), stat.st_mtime_ns, stat.st_size))
     except yaml.YAMLError as e:
         raise ConfigError(f"Failed to parse configuration file: {e}")
 
@@ -81,6 +81,17 @@ class CronGateway(Gateway):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Optional async cleanup hook.
+        
+        Called on the server's event loop after shutdown(), when the server is
+        stopping. Use for resources that must be closed from async code, such
+        as an httpx.AsyncClient or final network writes.
+        
+        Default implementation does nothing.
+        """
+        pass
+
     @staticmethod
     def extract_pipeline_kwargs(inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Extract pipeline kwargs from raw inputs, stripping _-prefixed keys.
@@ -349,6 +349,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     if scheduler and scheduler.job_count > 0:
         scheduler.shutdown()
+        await scheduler.aclose()
 
     for shutdown_fn in getattr(app.state, "_gateway_shutdowns", []):
         try:
@@ -10,7 +10,6 @@ import logging
 import os
 import secrets
 import time
-from hashlib import sha256
 from typing import Callable
 
 from fastapi import HTTPException, Request, Response, status
@@ -48,7 +47,7 @@ def generate_token() -> str:
 def _sign(token: str, issued_at: int) -> str:
     """Create HMAC signature for session cookie."""
     msg = str(issued_at).encode()
-    return hmac.new(token.encode(), msg, sha256).hexdigest()
+    return hmac.digest(token.encode(), msg, "sha256").hex()
 
 
 def create_session_cookie_value(token: str) -> str:
@@ -9,6 +9,12 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 @dataclass
 class ProgramMetrics:
@@ -74,7 +80,7 @@ def compute_program_metrics(logs_dir: Path, program_name: str) -> ProgramMetrics
                     continue
 
                 try:
-                    entry = json.loads(line)
+                    entry = _json_loads(line)
                 except json.JSONDecodeError:
                     continue
 
@@ -193,6 +193,14 @@ class GatewayScheduler:
             self.scheduler.shutdown(wait=False)
             logger.info("GatewayScheduler shutdown")
 
+    async def aclose(self):
+        """Run each gateway's async cleanup hook; call after shutdown()."""
+        for gateway in self._gateways:
+            try:
+                await gateway.aclose()
+            except Exception as e:
+                logger.error(f"Gateway aclose error: {e}", exc_info=True)
+
     @property
     def job_count(self) -> int:
         """Number of registered cron jobs."""
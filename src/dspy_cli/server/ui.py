@@ -2,6 +2,8 @@
 
 import json
 import logging
+import mmap
+import os
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -10,6 +12,38 @@ from fastapi.responses import HTMLResponse
 
 logger = logging.getLogger(__name__)
 
+try:
+    # orjson is optional; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _read_last_lines(log_file: Path, limit: int) -> List[bytes]:
+    """Read the last ``limit`` non-empty lines of a file without loading all of it.
+
+    Memory-maps the file and walks backwards with ``rfind`` (a C-level memchr
+    scan), so only the bytes of the returned lines are copied regardless of
+    how large the log file has grown.
+    """
+    lines: List[bytes] = []
+
+    with open(log_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return lines
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            end = len(mm)
+            while end > 0 and len(lines) < limit:
+                start = mm.rfind(b"\n", 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    lines.append(line)
+                end = start - 1
+
+    lines.reverse()
+    return lines
+
 
 def get_recent_logs(logs_dir: Path, program_name: str, limit: int = 50) -> List[Dict[str, Any]]:
     """Read recent log entries for a program.
@@ -28,28 +62,22 @@ def get_recent_logs(logs_dir: Path, program_name: str, limit: int = 50) -> List[
         logger.debug(f"Log file does not exist: {log_file}")
         return []
 
+    if limit <= 0:
+        return []
+
     logs = []
 
     try:
-        with open(log_file, "r") as f:
-            # Read all lines
-            lines = f.readlines()
-
-            # Take the last N lines
-            recent_lines = lines[-limit:] if len(lines) > limit else lines
-
-            # Parse JSON from each line
-            for line in recent_lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    log_entry = json.loads(line)
-                    logs.append(log_entry)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse log line: {e}")
-                    continue
+        recent_lines = _read_last_lines(log_file, limit)
+
+        # Parse JSON from each line
+        for line in recent_lines:
+            try:
+                log_entry = _json_loads(line)
+                logs.append(log_entry)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse log line: {e}")
+                continue
 
         # Reverse to show most recent first
         logs.reverse()
@@ -181,6 +181,19 @@ class TestCronGateway:
         # Should not raise
         run_async(gateway.on_error({"text": "test"}, error))
 
+    def test_aclose_default_noop(self):
+        """Default aclose should be a no-op."""
+        class TestGateway(CronGateway):
+            schedule = "0 * * * *"
+            async def get_pipeline_inputs(self) -> List[Dict[str, Any]]:
+                return []
+            async def on_complete(self, inputs: Dict[str, Any], output: Any) -> None:
+                pass
+
+        gateway = TestGateway()
+        # Should not raise
+        run_async(gateway.aclose())
+
     def test_on_error_can_be_overridden(self):
         """Subclass can override on_error to handle failures."""
         errors_received = []
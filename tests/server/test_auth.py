@@ -0,0 +1,34 @@
+"""Tests for session cookie signing."""
+
+import hashlib
+import hmac
+import time
+
+from dspy_cli.server.auth import create_session_cookie_value, verify_session_cookie
+
+
+def test_session_cookie_roundtrip():
+    """A freshly created cookie verifies against the same token."""
+    value = create_session_cookie_value("secret-token")
+
+    assert verify_session_cookie("secret-token", value)
+
+
+def test_session_cookie_rejects_other_token():
+    """A cookie signed with one token does not verify with another."""
+    value = create_session_cookie_value("secret-token")
+
+    assert not verify_session_cookie("other-token", value)
+
+
+def test_session_cookie_signature_format():
+    """Signatures stay hex-encoded HMAC-SHA256 so existing cookies remain valid."""
+    issued_at = int(time.time())
+    expected = hmac.new(b"secret-token", str(issued_at).encode(), hashlib.sha256).hexdigest()
+
+    assert verify_session_cookie("secret-token", f"{issued_at}.{expected}")
+
+
+def test_session_cookie_rejects_malformed_value():
+    """Malformed cookie values are rejected."""
+    assert not verify_session_cookie("secret-token", "not-a-cookie")
@@ -1,5 +1,6 @@
 """Tests for GatewayScheduler."""
 
+import asyncio
 from typing import Any, Dict, List
 from unittest.mock import MagicMock
 
@@ -104,6 +105,56 @@ class TestGatewayScheduler:
         scheduler = GatewayScheduler(logs_dir=tmp_path)
         scheduler.shutdown()
 
+    def test_aclose_calls_gateway_aclose(self, tmp_path, mock_module, mock_lm):
+        """aclose() runs every registered gateway's async cleanup hook."""
+        closed = []
+
+        class ClosingGateway(MockCronGateway):
+            async def aclose(self) -> None:
+                closed.append(self)
+
+        scheduler = GatewayScheduler(logs_dir=tmp_path)
+        gateway = ClosingGateway()
+        scheduler.register_cron_gateway(
+            module=mock_module,
+            gateway=gateway,
+            lm=mock_lm,
+            model_name="test-model",
+        )
+
+        scheduler.shutdown()
+        asyncio.get_event_loop().run_until_complete(scheduler.aclose())
+
+        assert closed == [gateway]
+
+    def test_aclose_continues_after_gateway_error(self, tmp_path, mock_lm):
+        """A failing gateway aclose() doesn't stop the others from closing."""
+        closed = []
+
+        class FailingGateway(MockCronGateway):
+            async def aclose(self) -> None:
+                raise RuntimeError("boom")
+
+        class ClosingGateway(MockCronGateway):
+            async def aclose(self) -> None:
+                closed.append(self)
+
+        scheduler = GatewayScheduler(logs_dir=tmp_path)
+        gateways = [FailingGateway(), ClosingGateway()]
+        for i, gateway in enumerate(gateways):
+            module = MagicMock(spec=DiscoveredModule)
+            module.name = f"Module{i}"
+            scheduler.register_cron_gateway(
+                module=module,
+                gateway=gateway,
+                lm=mock_lm,
+                model_name="test-model",
+            )
+
+        asyncio.get_event_loop().run_until_complete(scheduler.aclose())
+
+        assert closed == [gateways[1]]
+
 
 class TestCronJobExecution:
     """Tests for cron job execution flow."""
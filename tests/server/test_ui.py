@@ -0,0 +1,68 @@
+"""Tests for UI log reading helpers."""
+
+import json
+
+from dspy_cli.server.ui import get_recent_logs
+
+
+def _write_log(path, entries):
+    with open(path, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def test_get_recent_logs_missing_file(tmp_path):
+    """Missing log file returns no entries."""
+    assert get_recent_logs(tmp_path, "Missing") == []
+
+
+def test_get_recent_logs_returns_most_recent_first(tmp_path):
+    """Only the last `limit` entries are returned, newest first."""
+    _write_log(tmp_path / "Prog.log", [{"i": i} for i in range(10)])
+
+    logs = get_recent_logs(tmp_path, "Prog", limit=3)
+
+    assert [entry["i"] for entry in logs] == [9, 8, 7]
+
+
+def test_get_recent_logs_large_file(tmp_path):
+    """Only the tail of a large log file is returned."""
+    _write_log(tmp_path / "Prog.log", [{"i": i, "pad": "x" * 40} for i in range(2000)])
+
+    logs = get_recent_logs(tmp_path, "Prog", limit=5)
+
+    assert [entry["i"] for entry in logs] == [1999, 1998, 1997, 1996, 1995]
+
+
+def test_get_recent_logs_limit_larger_than_file(tmp_path):
+    """Requesting more entries than exist returns all of them."""
+    _write_log(tmp_path / "Prog.log", [{"i": i} for i in range(3)])
+
+    logs = get_recent_logs(tmp_path, "Prog", limit=50)
+
+    assert [entry["i"] for entry in logs] == [2, 1, 0]
+
+
+def test_get_recent_logs_skips_invalid_lines(tmp_path):
+    """Blank and malformed lines are skipped."""
+    (tmp_path / "Prog.log").write_text('{"i": 0}\n\nnot json\n{"i": 1}\n')
+
+    logs = get_recent_logs(tmp_path, "Prog", limit=10)
+
+    assert [entry["i"] for entry in logs] == [1, 0]
+
+
+def test_get_recent_logs_empty_file(tmp_path):
+    """Empty log file returns no entries."""
+    (tmp_path / "Prog.log").write_text("")
+
+    assert get_recent_logs(tmp_path, "Prog") == []
+
+
+def test_get_recent_logs_without_trailing_newline(tmp_path):
+    """The final line is read even when the file doesn't end in a newline."""
+    (tmp_path / "Prog.log").write_text('{"i": 0}\n{"i": 1}')
+
+    logs = get_recent_logs(tmp_path, "Prog", limit=10)
+
+    assert [entry["i"] for entry in logs] == [1, 0]
@@ -35,3 +35,43 @@ def test_load_config_missing_models_section(tmp_path):
         load_config(config_path)
 
     assert "models" in str(exc_info.value)
+
+
+def test_load_config_returns_independent_copies(tmp_path):
+    """Cached parses are copied so mutations don't leak between calls."""
+    config_path = tmp_path / "dspy.config.yaml"
+    config_path.write_text(
+        "models:\n"
+        "  default: test:model\n"
+        "  registry:\n"
+        "    test:model:\n"
+        "      model: openai/gpt-4o-mini\n"
+    )
+
+    first = load_config(config_path)
+    first["models"]["registry"]["test:model"]["model"] = "mutated"
+    second = load_config(config_path)
+
+    assert second["models"]["registry"]["test:model"]["model"] == "openai/gpt-4o-mini"
+
+
+def test_load_config_picks_up_file_changes(tmp_path):
+    """Editing the config file invalidates the cached parse."""
+    config_path = tmp_path / "dspy.config.yaml"
+    config_path.write_text(
+        "models:\n"
+        "  default: a:model\n"
+        "  registry:\n"
+        "    a:model:\n"
+        "      model: openai/a\n"
+    )
+    assert load_config(config_path)["models"]["default"] == "a:model"
+
+    config_path.write_text(
+        "models:\n"
+        "  default: b:model\n"
+        "  registry:\n"
+        "    b:model:\n"
+        "      model: openai/b-longer\n"
+    )
+    assert load_config(config_path)["models"]["default"] == "b:model"